@@ -0,0 +1,231 @@
+# assets.py
+
+import hashlib
+import os
+import re
+import threading
+import urllib.request
+
+import fragments
+import images
+from content import BASE_DIR
+
+# --- STATIC ASSETS ---
+# When the app is started through serve.py, the profile photo derivatives, the
+# page stylesheet and self-hosted web fonts are served from /assets/ under
+# content-hashed names. A name never changes meaning, so responses carry
+# immutable cache headers and repeat visitors revalidate nothing at all.
+# Under a plain `streamlit run app.py` the pages inline the same content instead.
+ASSETS_ENV = "PORTFOLIO_ASSETS"
+ASSET_PREFIX = "/assets/"
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Self-hosted fonts: fonts.css plus the files its url()s name, written by `cli.py fetch-fonts`.
+FONTS_DIR = os.path.join(BASE_DIR, "fonts")
+FONTS_CSS = os.path.join(FONTS_DIR, "fonts.css")
+GOOGLE_FONTS_URL = "https://fonts.googleapis.com/css2?family=Agdasima&family=Roboto&display=swap"
+# Google only serves woff2 to browsers it recognizes.
+FETCH_USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                    "(KHTML, like Gecko) Chrome/124.0 Safari/537.36")
+
+CONTENT_TYPES = {
+    ".css": "text/css; charset=utf-8",
+    ".webp": "image/webp",
+    ".jpg": "image/jpeg",
+    ".woff2": "font/woff2",
+    ".woff": "font/woff",
+    ".ttf": "font/ttf",
+}
+_URL_PATTERN = re.compile(r"url\((['\"]?)([^)'\"]+)\1\)")
+
+_lock = threading.Lock()
+_state = {"styles": None, "profile": None}
+
+
+class Asset:
+    __slots__ = ("name", "data", "content_type", "etag")
+
+    def __init__(self, stem, ext, data):
+        self.etag = hashlib.sha1(data).hexdigest()
+        self.name = f"{stem}-{self.etag[:12]}{ext}"
+        self.data = data
+        self.content_type = CONTENT_TYPES[ext]
+
+
+class Bundle:
+    """A set of assets of one content version, by name, plus what pages link to."""
+
+    __slots__ = ("assets", "links")
+
+    def __init__(self, assets, links):
+        self.assets = assets
+        self.links = links  # the stylesheet name, or display width -> (1x name, 2x name) for the photo
+
+
+def enabled():
+    return os.environ.get(ASSETS_ENV) == "1"
+
+
+def url(name):
+    return ASSET_PREFIX + name
+
+
+# --- FONTS ---
+
+def _fonts_key():
+    try:
+        stat = os.stat(FONTS_CSS)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def font_assets():
+    """Return (@font-face CSS pointing at the asset URLs, [Asset]) for the self-hosted fonts.
+
+    Without a fonts directory the CSS is the Google Fonts @import the pages have always used.
+    """
+    try:
+        with open(FONTS_CSS, encoding="utf-8") as f:
+            css = f.read()
+    except FileNotFoundError:
+        return fragments.FONT_IMPORTS, []
+    found = {}
+
+    def replace(match):
+        filename = match.group(2)
+        if filename not in found:
+            stem, ext = os.path.splitext(filename)
+            with open(os.path.join(FONTS_DIR, filename), "rb") as f:
+                found[filename] = Asset(f"font-{stem}", ext, f.read())
+        return f"url('{url(found[filename].name)}')"
+    return _URL_PATTERN.sub(replace, css), list(found.values())
+
+
+def fetch_fonts(source=GOOGLE_FONTS_URL, out_dir=FONTS_DIR):
+    """Download the Google Fonts stylesheet and its font files for self-hosting.
+
+    Returns the number of font files written.
+    """
+    def get(address):
+        request = urllib.request.Request(address, headers={"User-Agent": FETCH_USER_AGENT})
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.read()
+
+    css = get(source).decode("utf-8")
+    os.makedirs(out_dir, exist_ok=True)
+    names = {}
+
+    def replace(match):
+        address = match.group(2)
+        if address not in names:
+            name = f"{len(names):02d}-{os.path.basename(address.split('?')[0])}"
+            with open(os.path.join(out_dir, name), "wb") as f:
+                f.write(get(address))
+            names[address] = name
+        return f"url({names[address]})"
+    css = _URL_PATTERN.sub(replace, css)
+    with open(os.path.join(out_dir, "fonts.css"), "w", encoding="utf-8") as f:
+        f.write(css)
+    return len(names)
+
+
+# --- BUNDLES ---
+# The stylesheet and fonts never depend on the photo, so they are built and
+# cached apart from it: a missing or unreadable photo only breaks the places
+# that show it.
+
+def _cached(part, key, build):
+    with _lock:
+        cached = _state[part]
+        if cached is not None and cached[0] == key:
+            return cached[1]
+    built = build()
+    with _lock:
+        _state[part] = (key, built)
+    return built
+
+
+def _build_styles():
+    font_css, fonts = font_assets()
+    stylesheet = Asset("style", ".css", (font_css + fragments.STYLE_CSS).encode("utf-8"))
+    return Bundle({asset.name: asset for asset in fonts + [stylesheet]}, stylesheet.name)
+
+
+def styles():
+    """Return the stylesheet and font Bundle, rebuilt only when the fonts or the CSS changed."""
+    return _cached("styles", (_fonts_key(), fragments.STYLE_CSS), _build_styles)
+
+
+def _build_profile(profile_images):
+    assets = {}
+    links = {}
+    for width, variants in profile_images.items():
+        names = []
+        for scale, data in sorted(variants.items()):
+            ext = ".webp" if images.mime_type(data) == "image/webp" else ".jpg"
+            asset = Asset(f"profile-{width * scale}", ext, data)
+            assets[asset.name] = asset
+            names.append(asset.name)
+        links[width] = tuple(names)
+    return Bundle(assets, links)
+
+
+def profile():
+    """Return the profile photo Bundle, rebuilt only when the photo changed.
+
+    Raises FileNotFoundError when the photo is missing.
+    """
+    profile_images = {width: images.derivatives(images.PROFILE_IMAGE, width) for width in images.PROFILE_WIDTHS}
+    # The derivatives are the cached bytes objects, so comparing them is an identity check.
+    key = tuple(data for variants in profile_images.values() for data in variants.values())
+    return _cached("profile", key, lambda: _build_profile(profile_images))
+
+
+def lookup(name):
+    asset = styles().assets.get(name)
+    if asset is not None or not name.startswith("profile-"):
+        return asset
+    try:
+        return profile().assets.get(name)
+    except FileNotFoundError:
+        return None
+
+
+def stylesheet_html():
+    return f"<style>@import url('{url(styles().links)}');</style>"
+
+
+def profile_image_html(width):
+    one_x, two_x = profile().links[width]
+    return (f"<div class='profile-image'><img src='{url(one_x)}' srcset='{url(one_x)} 1x, {url(two_x)} 2x' "
+            f"width='{width}' alt='Gururaj H C'></div>")
+
+
+# --- HTTP ---
+
+def etag_matches(header, etag):
+    """Whether an If-None-Match header names etag (weak or strong) or is "*"."""
+    if not header:
+        return False
+    candidates = [value.strip() for value in header.split(",")]
+    return "*" in candidates or any(value.removeprefix("W/").strip('"') == etag for value in candidates)
+
+
+async def _serve(request):
+    from starlette.concurrency import run_in_threadpool
+    from starlette.responses import Response
+    # Building the photo bundle may encode the photo; keep that off the event loop.
+    asset = await run_in_threadpool(lookup, request.path_params["name"])
+    if asset is None:
+        return Response(status_code=404)
+    headers = {"Cache-Control": CACHE_CONTROL, "ETag": f'"{asset.etag}"'}
+    if etag_matches(request.headers.get("if-none-match"), asset.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(asset.data, media_type=asset.content_type, headers=headers)
+
+
+def routes():
+    """Starlette routes that serve the asset bundles; mounted by serve.py."""
+    from starlette.routing import Route
+    return [Route(ASSET_PREFIX + "{name}", _serve, methods=["GET", "HEAD"])]
@@ -0,0 +1,337 @@
+# bench.py
+
+import json
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+import urllib.request
+from contextlib import contextmanager
+
+import content
+import images
+import memory
+import prefetch
+import search
+import watcher
+
+APP_PATH = os.path.join(content.BASE_DIR, "app.py")
+BENCH_VERSION = 2
+PAGE_PARAM = "page"
+DEFAULT_THRESHOLD = 0.2
+# Timing differences below this many milliseconds are noise, whatever the ratio.
+MIN_DELTA_MS = 2.0
+
+# (metric path, True if higher is better) checked against the baseline.
+COMPARED = (
+    (("cold_ms",), False),
+    (("warm_ms", "median"), False),
+    (("warm_ms", "p95"), False),
+    (("alloc_peak_kib",), False),
+    (("elements",), False),
+)
+COMPARED_STORE = (
+    (("total_kib",), False),
+)
+COMPARED_CONCURRENCY = (
+    (("throughput_rps",), True),
+    (("latency_ms", "p50"), False),
+    (("latency_ms", "p95"), False),
+    (("latency_ms", "p99"), False),
+)
+
+# --- HEADLESS RENDERING ---
+# Single pages are measured in-process with Streamlit's AppTest. Pages are
+# selected through the ?page= deep link, since the option_menu component only
+# reacts to clicks in a browser.
+
+def page_names():
+    return [name for name, _, _ in content.PAGES]
+
+
+def new_session():
+    from streamlit.testing.v1 import AppTest
+    return AppTest.from_file(APP_PATH, default_timeout=60)
+
+
+def render(session, page):
+    """Run one page in a session and return its wall time in milliseconds."""
+    session.query_params[PAGE_PARAM] = page
+    start = time.perf_counter()
+    session.run()
+    elapsed = (time.perf_counter() - start) * 1000
+    if session.exception:
+        raise RuntimeError(f"{page}: {session.exception[0].value}")
+    return elapsed
+
+
+def _count_elements(node):
+    children = getattr(node, "children", None)
+    if children is None:
+        return 1
+    return sum(_count_elements(child) for child in children.values())
+
+
+def clear_caches():
+    """Forget everything derived from the content, as a freshly started replica would."""
+    content.clear_cache()
+    images.clear_cache()
+    search.clear_cache()
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def _summary(values):
+    return {
+        "median": round(statistics.median(values), 3),
+        "p95": round(percentile(values, 0.95), 3),
+        "min": round(min(values), 3),
+        "max": round(max(values), 3),
+    }
+
+
+# --- MEASUREMENTS ---
+
+def bench_page(page, runs=10):
+    """Cold and warm render times, allocations and element count of one page."""
+    clear_caches()
+    session = new_session()
+    cold = render(session, page)
+    elements = _count_elements(session._tree)
+    warm = [render(session, page) for _ in range(runs)]
+    # tracemalloc slows everything down, so allocations get their own warm run.
+    tracemalloc.start()
+    try:
+        render(session, page)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "cold_ms": round(cold, 3),
+        "warm_ms": _summary(warm),
+        "alloc_peak_kib": round(peak / 1024, 1),
+        "elements": elements,
+    }
+
+
+# --- CONCURRENT SESSIONS ---
+# AppTest sets up and tears down a global runtime on every run, so concurrent
+# sessions are driven against a real server instead: each session is a
+# websocket speaking Streamlit's own protocol, exactly like a browser tab.
+
+class ServerSession:
+    def __init__(self, url):
+        from websockets.sync.client import connect
+        self.socket = connect(url.rstrip("/").replace("http", "ws", 1) + "/_stcore/stream",
+                              subprotocols=["streamlit"], max_size=None)
+
+    def render(self, page):
+        """Rerun the script on `page` and return (milliseconds, deltas received)."""
+        from urllib.parse import urlencode
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+        request = BackMsg()
+        request.rerun_script.query_string = urlencode({PAGE_PARAM: page})
+        start = time.perf_counter()
+        self.socket.send(request.SerializeToString())
+        deltas = 0
+        while True:
+            msg = ForwardMsg()
+            msg.ParseFromString(self.socket.recv())
+            kind = msg.WhichOneof("type")
+            if kind == "delta":
+                deltas += 1
+            elif kind == "script_finished":
+                break
+        elapsed = (time.perf_counter() - start) * 1000
+        if msg.script_finished != ForwardMsg.FINISHED_SUCCESSFULLY:
+            raise RuntimeError(f"{page}: {ForwardMsg.ScriptFinishedStatus.Name(msg.script_finished)}")
+        return elapsed, deltas
+
+    def close(self):
+        self.socket.close()
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def local_server(timeout=60):
+    """Start `streamlit run app.py` on a free port and yield its URL."""
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", APP_PATH, "--server.headless=true",
+         f"--server.port={port}", "--server.address=127.0.0.1", "--browser.gatherUsageStats=false"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                with urllib.request.urlopen(f"{url}/_stcore/health", timeout=1):
+                    break
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError(f"streamlit did not start on port {port}")
+                time.sleep(0.2)
+        yield url
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def bench_concurrency(url, pages, sessions=8, renders=20, seed=0):
+    """Drive `sessions` concurrent sessions, each rendering `renders` random pages."""
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    go = threading.Event()
+    clients = []
+    try:
+        for worker_id in range(sessions):
+            client = ServerSession(url)
+            clients.append(client)
+            # A session's first run is its own start-up, not steady-state traffic.
+            client.render(pages[worker_id % len(pages)])
+
+        def worker(client, rng):
+            go.wait()
+            for _ in range(renders):
+                try:
+                    elapsed, _ = client.render(rng.choice(pages))
+                except Exception as e:
+                    with lock:
+                        errors.append(str(e))
+                    continue
+                with lock:
+                    latencies.append(elapsed)
+
+        threads = [threading.Thread(target=worker, args=(client, random.Random(seed + i)), name=f"bench-session-{i}")
+                   for i, client in enumerate(clients)]
+        for thread in threads:
+            thread.start()
+        start = time.perf_counter()
+        go.set()
+        for thread in threads:
+            thread.join()
+        wall = time.perf_counter() - start
+    finally:
+        for client in clients:
+            client.close()
+    return {
+        "sessions": sessions,
+        "renders": len(latencies),
+        "errors": len(errors),
+        "seconds": round(wall, 3),
+        "throughput_rps": round(len(latencies) / wall, 2) if wall else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 0.50), 3),
+            "p95": round(percentile(latencies, 0.95), 3),
+            "p99": round(percentile(latencies, 0.99), 3),
+            "max": round(max(latencies, default=0.0), 3),
+        },
+    }
+
+
+def run(pages=None, runs=10, sessions=8, renders=20, url=None):
+    """Benchmark every page, then drive `sessions` concurrent sessions against url or a local server."""
+    import streamlit
+    pages = pages or page_names()
+    results = {
+        "version": BENCH_VERSION,
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "machine": platform.machine(),
+        "pages": {},
+    }
+    # The watcher and the prefetcher would warm caches behind the cold measurements.
+    saved = {name: os.environ.get(name) for name in (watcher.WATCH_INTERVAL_ENV, prefetch.PREFETCH_PAGES_ENV)}
+    os.environ.update(dict.fromkeys(saved, "0"))
+    try:
+        # One untimed pass pays the process-wide imports (app modules, option_menu
+        # and pandas, PIL), so no page's cold time depends on where it is in the order.
+        session = new_session()
+        for page in pages:
+            render(session, page)
+        for page in pages:
+            results["pages"][page] = bench_page(page, runs)
+        # Memory shared by every session, measured with all content warm.
+        watcher.warm_all()
+        results["store"] = {"total_kib": round(memory.footprint()["total"] / 1024, 1)}
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                del os.environ[name]
+            else:
+                os.environ[name] = value
+    if sessions > 0:
+        if url:
+            results["concurrency"] = bench_concurrency(url, pages, sessions, renders)
+        else:
+            with local_server() as local_url:
+                results["concurrency"] = bench_concurrency(local_url, pages, sessions, renders)
+    return results
+
+
+# --- BASELINE COMPARISON ---
+
+def _lookup(data, path):
+    for key in path:
+        if not isinstance(data, dict) or key not in data:
+            return None
+        data = data[key]
+    return data
+
+
+def _regressed(current, previous, higher_is_better, threshold, is_time):
+    if current is None or not previous:
+        return False
+    change = (previous - current) if higher_is_better else (current - previous)
+    if is_time and change < MIN_DELTA_MS:
+        return False
+    return change > threshold * previous
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return a list of human-readable regressions of results against baseline."""
+    regressions = []
+    checks = [(("pages", page), COMPARED) for page in baseline.get("pages", {})]
+    checks.append((("store",), COMPARED_STORE))
+    checks.append((("concurrency",), COMPARED_CONCURRENCY))
+    for prefix, compared in checks:
+        for path, higher_is_better in compared:
+            previous = _lookup(baseline, prefix + path)
+            current = _lookup(results, prefix + path)
+            is_time = path[0].endswith("_ms")
+            if _regressed(current, previous, higher_is_better, threshold, is_time):
+                change = (current - previous) / previous * 100
+                regressions.append(f"{' / '.join(prefix[-1:] + path)}: "
+                                   f"{previous} -> {current} ({change:+.0f}%)")
+    return regressions
+
+
+def load_results(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_results(results, path):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    os.replace(tmp_path, path)
@@ -0,0 +1,163 @@
+# cli.py
+
+import argparse
+import os
+import sys
+import time
+
+import assets
+import bench
+import content
+import export
+import memory
+import search
+import validate
+import watcher
+
+
+def report_problems(problems):
+    for problem in problems:
+        print(f"error: {problem}", file=sys.stderr)
+    if problems:
+        print(f"{len(problems)} problem(s) found; nothing was written.", file=sys.stderr)
+    return 1 if problems else 0
+
+
+def cmd_validate(args):
+    workbooks, _, problems = validate.validate()
+    if problems:
+        return report_problems(problems)
+    rows = sum(len(table) for _, tables in workbooks.values() for table in tables.values())
+    print(f"{len(workbooks)} workbooks, {rows} rows: no problems")
+    return 0
+
+
+def cmd_compile(args):
+    start = time.perf_counter()
+    # The search index is written next to the snapshot, from the same validated content.
+    index_path = os.path.join(os.path.dirname(os.path.abspath(args.output)), os.path.basename(search.INDEX_PATH))
+    problems, search_index = validate.build(args.output, index_path)
+    if problems:
+        return report_problems(problems)
+    print(f"Wrote {args.output} ({len(content.WORKBOOKS)} workbooks, {time.perf_counter() - start:.2f}s)")
+    print(f"Wrote {index_path} ({len(search_index.docs)} documents, {len(search_index.terms)} terms)")
+    return 0
+
+
+def cmd_import_db(args):
+    import contentdb
+    start = time.perf_counter()
+    problems = contentdb.import_workbooks(args.output, validate.check_workbook)
+    if problems:
+        return report_problems(problems)
+    print(f"Wrote {args.output} ({len(content.WORKBOOKS)} workbooks, {time.perf_counter() - start:.2f}s); "
+          f"serve it with {content.BACKEND_ENV}=sqlite")
+    return 0
+
+
+def cmd_export(args):
+    start = time.perf_counter()
+    report = export.export_site(args.output, force=args.force)
+    for name, output, status, seconds in report:
+        print(f"{name:<28} {output:<32} {status:<10} {seconds * 1000:8.1f} ms")
+    built = sum(1 for _, _, status, _ in report if status == "built")
+    print(f"Exported {built}/{len(report)} pages to {args.output} in {time.perf_counter() - start:.2f}s")
+    return 0
+
+
+def cmd_fetch_fonts(args):
+    count = assets.fetch_fonts(args.url, args.output)
+    print(f"Wrote {count} font files and fonts.css to {args.output}")
+    return 0
+
+
+def cmd_footprint(args):
+    watcher.warm_all()
+    report = memory.footprint()
+    print(f"{'workbook':<32} {'sheets':>9} {'records':>9} {'html':>9}  (KiB)")
+    for filename, parts in report["workbooks"].items():
+        print(f"{filename:<32} {parts['sheets'] / 1024:9.1f} {parts.get('records', 0) / 1024:9.1f} "
+              f"{parts.get('html', 0) / 1024:9.1f}")
+    for part in ("snapshot", "images", "search", "total"):
+        print(f"{part:<32} {report[part] / 1024:9.1f}")
+    return 0
+
+
+def cmd_bench(args):
+    results = bench.run(args.page, runs=args.runs, sessions=args.sessions, renders=args.renders, url=args.url)
+    bench.save_results(results, args.output)
+    print(f"{'page':<28} {'cold ms':>9} {'warm ms':>9} {'p95 ms':>9} {'peak KiB':>9} {'elements':>9}")
+    for page, result in results["pages"].items():
+        warm = result["warm_ms"]
+        print(f"{page:<28} {result['cold_ms']:9.1f} {warm['median']:9.1f} {warm['p95']:9.1f} "
+              f"{result['alloc_peak_kib']:9.1f} {result['elements']:9d}")
+    concurrency = results.get("concurrency")
+    if concurrency:
+        latency = concurrency["latency_ms"]
+        print(f"{concurrency['sessions']} sessions: {concurrency['throughput_rps']:.1f} renders/s, "
+              f"p50 {latency['p50']:.1f} ms, p95 {latency['p95']:.1f} ms, p99 {latency['p99']:.1f} ms, "
+              f"{concurrency['errors']} errors")
+    print(f"Wrote {args.output}")
+    if not args.baseline:
+        return 0
+    if not os.path.exists(args.baseline):
+        bench.save_results(results, args.baseline)
+        print(f"No baseline yet: saved these results as {args.baseline}")
+        return 0
+    regressions = bench.compare(results, bench.load_results(args.baseline), args.threshold)
+    for regression in regressions:
+        print(f"regression: {regression}", file=sys.stderr)
+    if regressions:
+        return 1
+    print(f"No regressions against {args.baseline} (threshold {args.threshold:.0%})")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build tools for the portfolio content.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    validate_parser = subparsers.add_parser("validate", help="Check every workbook's columns and rows, writing nothing.")
+    validate_parser.set_defaults(func=cmd_validate)
+
+    compile_parser = subparsers.add_parser("compile", aliases=["build"],
+                                           help="Validate every .xlsx workbook and compile it, with its records, "
+                                                "into one snapshot file.")
+    compile_parser.add_argument("-o", "--output", default=content.SNAPSHOT_PATH)
+    compile_parser.set_defaults(func=cmd_compile)
+
+    import_parser = subparsers.add_parser("import-db", help="Import every .xlsx workbook into the SQLite backend.")
+    import_parser.add_argument("-o", "--output", default=content.DB_PATH)
+    import_parser.set_defaults(func=cmd_import_db)
+
+    export_parser = subparsers.add_parser("export", help="Write the portfolio as a static HTML/CSS site.")
+    export_parser.add_argument("-o", "--output", default="site")
+    export_parser.add_argument("--force", action="store_true", help="Rebuild every page, not just changed ones.")
+    export_parser.set_defaults(func=cmd_export)
+
+    fonts_parser = subparsers.add_parser("fetch-fonts", help="Download the web fonts so serve.py can self-host them.")
+    fonts_parser.add_argument("-o", "--output", default=assets.FONTS_DIR)
+    fonts_parser.add_argument("--url", default=assets.GOOGLE_FONTS_URL, help="Google Fonts stylesheet to download.")
+    fonts_parser.set_defaults(func=cmd_fetch_fonts)
+
+    footprint_parser = subparsers.add_parser("footprint", help="Report the memory held by the shared content store.")
+    footprint_parser.set_defaults(func=cmd_footprint)
+
+    bench_parser = subparsers.add_parser("bench", help="Benchmark every page and compare against a baseline.")
+    bench_parser.add_argument("-o", "--output", default="bench.json")
+    bench_parser.add_argument("--page", action="append", help="Benchmark only this page (repeatable).")
+    bench_parser.add_argument("--runs", type=int, default=10, help="Warm renders per page.")
+    bench_parser.add_argument("--sessions", type=int, default=8, help="Concurrent sessions; 0 skips the load test.")
+    bench_parser.add_argument("--renders", type=int, default=20, help="Renders per concurrent session.")
+    bench_parser.add_argument("--url", help="Load-test this running app instead of starting a local server.")
+    bench_parser.add_argument("--baseline", help="Compare against this results file, creating it if missing.")
+    bench_parser.add_argument("--threshold", type=float, default=bench.DEFAULT_THRESHOLD,
+                              help="Relative slowdown that counts as a regression.")
+    bench_parser.set_defaults(func=cmd_bench)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,413 @@
+# content.py
+
+import hashlib
+import math
+import os
+import pickle
+import threading
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_PATH = os.path.join(BASE_DIR, "content.snapshot.pkl")
+SNAPSHOT_VERSION = 4
+DB_PATH = os.path.join(BASE_DIR, "content.db")
+BACKEND_ENV = "PORTFOLIO_CONTENT_BACKEND"
+
+# --- WORKBOOK REGISTRY ---
+# filename -> (sheet name, or None for "every sheet", required columns)
+WORKBOOKS = {
+    "My_True_North.xlsx": ("My True North", ['Sub-title', 'Content']),
+    "Education.xlsx": ("Education", ['Degree', 'Institution', 'Year']),
+    "Data_Science_projects.xlsx": (None, ['Project title', 'Description', 'GitHub repo link']),
+    "Pre_prints.xlsx": ("Pre-prints", ['Title', 'Abstract', 'Available at']),
+    "Publications.xlsx": ("Publications", ['Title', 'Abstract', 'Available at']),
+    "Work_Experience.xlsx": ("Work_Experience", ['Designation', 'Organization', 'Duration', 'Job desscription']),
+    "Work_projects.xlsx": ("Work_projects", ['Project title', 'Project Description', 'Goal', 'Solution', 'Results',
+                                             'Learning']),
+    "Awards_and_Achievements.xlsx": ("Awards_and_Achievements", ['Timeline', 'Description']),
+    "Contact_details.xlsx": ("Contact_details", ['Platform', 'Link']),
+}
+
+# --- PAGES ---
+# (menu label, option_menu icon, workbook backing the page or None)
+PAGES = (
+    ("My True North", "house-heart-fill", "My_True_North.xlsx"),
+    ("Education", "mortarboard-fill", "Education.xlsx"),
+    ("Data Science Projects", "robot", "Data_Science_projects.xlsx"),
+    ("Pre-prints", "file-earmark-arrow-up-fill", "Pre_prints.xlsx"),
+    ("Publications", "journal-text", "Publications.xlsx"),
+    ("Work Experience", "briefcase-fill", "Work_Experience.xlsx"),
+    ("Work Projects", "kanban-fill", "Work_projects.xlsx"),
+    ("Awards and Achievements", "trophy-fill", "Awards_and_Achievements.xlsx"),
+    ("Contact Details", "person-lines-fill", "Contact_details.xlsx"),
+    ("Search", "search", None),
+)
+
+# Column holding the expander label of each workbook whose entries are shown collapsed.
+TITLE_COLUMNS = {
+    "Data_Science_projects.xlsx": "Project title",
+    "Pre_prints.xlsx": "Title",
+    "Publications.xlsx": "Title",
+    "Work_projects.xlsx": "Project title",
+}
+
+# --- WORKBOOK CACHE ---
+# Parsed workbooks are kept per process and keyed by the backend's change key,
+# (mtime, size) of the .xlsx for Excel, so an edited workbook is re-read on the
+# next rerun while unchanged ones never reach openpyxl.
+_lock = threading.Lock()
+_cache = {}
+_workbook_locks = {}
+_builders = {}
+_stats = {"hits": 0, "misses": 0, "snapshot_loads": 0, "xlsx_parses": 0}
+_snapshot = {"key": None, "data": None}
+
+
+def workbook_path(filename):
+    return os.path.join(BASE_DIR, filename)
+
+
+def _file_key(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def file_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class Table:
+    """A parsed worksheet: column names plus rows of plain Python values."""
+
+    __slots__ = ("columns", "rows")
+
+    def __init__(self, columns, rows):
+        self.columns = tuple(columns)
+        self.rows = tuple(tuple(row) for row in rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def iterrows(self):
+        for index, row in enumerate(self.rows):
+            yield index, dict(zip(self.columns, row))
+
+
+def _plain(value):
+    # Keep the snapshot free of numpy/pandas objects so loading it never imports them.
+    # Blank cells become None, as they do in the SQLite backend, instead of NaN.
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def _read_xlsx(path):
+    # pandas only pulls in openpyxl inside read_excel, so this is the one place
+    # that pays for either import.
+    import pandas as pd
+    frames = pd.read_excel(path, sheet_name=None)
+    return {name: Table([str(col) for col in df.columns],
+                        zip(*([_plain(value) for value in df[col].tolist()] for col in df.columns)))
+            for name, df in frames.items()}
+
+
+def _tables_from_snapshot(sheets):
+    return {name: Table(sheet["columns"], sheet["rows"]) for name, sheet in sheets.items()}
+
+
+def _snapshot_from_tables(tables):
+    return {name: {"columns": table.columns, "rows": table.rows} for name, table in tables.items()}
+
+
+def _load_snapshot():
+    try:
+        key = _file_key(SNAPSHOT_PATH)
+    except FileNotFoundError:
+        return None
+    with _lock:
+        if _snapshot["key"] == key:
+            return _snapshot["data"]
+    try:
+        with open(SNAPSHOT_PATH, "rb") as f:
+            data = pickle.load(f)
+    except Exception:
+        # Unreadable, truncated or written by incompatible code: parse the workbooks instead.
+        data = None
+    if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+        data = None
+    with _lock:
+        _snapshot["key"], _snapshot["data"] = key, data
+    return data
+
+
+def _parse(path, filename):
+    """Return (sha1 of the file, {sheet_name: Table})."""
+    digest = file_digest(path)
+    snapshot = _load_snapshot()
+    if snapshot is not None:
+        entry = snapshot["workbooks"].get(filename)
+        if entry is not None and entry["sha1"] == digest:
+            with _lock:
+                _stats["snapshot_loads"] += 1
+            return digest, _tables_from_snapshot(entry["sheets"])
+    with _lock:
+        _stats["xlsx_parses"] += 1
+    return digest, _read_xlsx(path)
+
+
+# --- BACKENDS ---
+# Where workbook tables are read from. Workbooks stay the authoring format
+# either way: the SQLite database is imported from them with `cli.py import-db`.
+
+class ExcelBackend:
+    """Reads each .xlsx file, or its entry in the compiled snapshot when that is current."""
+
+    name = "excel"
+
+    def key(self, filename):
+        return _file_key(workbook_path(filename))
+
+    def load(self, filename):
+        return _parse(workbook_path(filename), filename)
+
+    def reader(self, filename):
+        # A workbook can only be parsed whole, so narrow reads come from the cached version.
+        return VersionReader(version(filename))
+
+
+_backends = {}
+
+
+def backend():
+    """Return the backend selected by PORTFOLIO_CONTENT_BACKEND ("excel", the default, or "sqlite")."""
+    name = os.environ.get(BACKEND_ENV, ExcelBackend.name)
+    with _lock:
+        instance = _backends.get(name)
+    if instance is not None:
+        return instance
+    if name == ExcelBackend.name:
+        instance = ExcelBackend()
+    elif name == "sqlite":
+        # Only imported when selected, like pandas for the Excel path.
+        import contentdb
+        instance = contentdb.SQLiteBackend(DB_PATH)
+    else:
+        raise ValueError(f"Unknown content backend {name!r}; use 'excel' or 'sqlite'.")
+    with _lock:
+        return _backends.setdefault(name, instance)
+
+
+class ContentVersion:
+    """One parsed version of a workbook plus everything derived from it."""
+
+    __slots__ = ("filename", "key", "digest", "sheets", "derived")
+
+    def __init__(self, filename, key, digest, sheets):
+        self.filename = filename
+        self.key = key
+        self.digest = digest
+        self.sheets = sheets
+        self.derived = {}
+
+    def derive(self, name, builder):
+        """Return builder(self), computed at most once for this version.
+
+        Builders are remembered per workbook so refresh() can rebuild them for
+        the next version before it becomes visible.
+        """
+        try:
+            return self.derived[name]
+        except KeyError:
+            _builders.setdefault(self.filename, {})[name] = builder
+            value = self.derived[name] = builder(self)
+            return value
+
+
+class VersionReader:
+    """Narrow reads (one column, one row) served from a single ContentVersion."""
+
+    __slots__ = ("filename", "current")
+
+    def __init__(self, current):
+        self.filename = current.filename
+        self.current = current
+
+    def sheet_columns(self):
+        return {name: table.columns for name, table in self.current.sheets.items()}
+
+    def column(self, sheet_name, name):
+        table = self.current.sheets[sheet_name]
+        index = table.columns.index(name)
+        return tuple(values[index] for values in table.rows)
+
+    def row(self, sheet_name, position):
+        table = self.current.sheets[sheet_name]
+        return dict(zip(table.columns, table.rows[position]))
+
+
+def _workbook_lock(filename):
+    with _lock:
+        lock = _workbook_locks.get(filename)
+        if lock is None:
+            lock = _workbook_locks[filename] = threading.Lock()
+        return lock
+
+
+def _load(filename, warm):
+    # One loader per workbook at a time: a rerun that arrives while the watcher
+    # is rebuilding a workbook waits for the finished version instead of
+    # parsing it a second time or seeing it half-built.
+    source = backend()
+    with _workbook_lock(filename):
+        key = source.key(filename)
+        with _lock:
+            entry = _cache.get(filename)
+        if entry is not None and entry.key == key:
+            return entry, False
+        entry = ContentVersion(filename, key, *source.load(filename))
+        if warm:
+            for name, builder in list(_builders.get(filename, {}).items()):
+                entry.derive(name, builder)
+        with _lock:
+            _cache[filename] = entry
+        return entry, True
+
+
+def version(filename):
+    """Return the current ContentVersion of a workbook, parsing it only if it changed."""
+    key = backend().key(filename)
+    with _lock:
+        entry = _cache.get(filename)
+        if entry is not None and entry.key == key:
+            _stats["hits"] += 1
+            return entry
+        _stats["misses"] += 1
+    return _load(filename, warm=False)[0]
+
+
+def is_current(filename):
+    """Return True when the cached version of a workbook matches its source; never parses."""
+    try:
+        key = backend().key(filename)
+    except OSError:
+        return False
+    with _lock:
+        entry = _cache.get(filename)
+    return entry is not None and entry.key == key
+
+
+def refresh(filename):
+    """Load a changed workbook and rebuild its derived values before swapping it in.
+
+    Returns True when a new version was installed.
+    """
+    return _load(filename, warm=True)[1]
+
+
+def reader(filename):
+    """Return a reader pinned to the current version of a workbook.
+
+    Its column(), row() and sheet_columns() all answer from that one version, so
+    titles and the bodies opened under them cannot straddle a swap. The SQLite
+    backend answers each read without loading the rest of the workbook.
+    """
+    return backend().reader(filename)
+
+
+def cache_stats():
+    with _lock:
+        return {**_stats, "entries": len(_cache)}
+
+
+def cached_versions():
+    """Return {filename: ContentVersion} for every workbook currently held in memory."""
+    with _lock:
+        return {entry.filename: entry for entry in _cache.values()}
+
+
+def cached_snapshot():
+    with _lock:
+        return _snapshot["data"]
+
+
+def clear_cache():
+    with _lock:
+        _cache.clear()
+        _snapshot["key"] = _snapshot["data"] = None
+        for name in _stats:
+            _stats[name] = 0
+
+
+# --- SNAPSHOT COMPILATION ---
+
+def check_workbook(filename, tables):
+    sheet_name, required_cols = WORKBOOKS[filename]
+    problems = []
+    if sheet_name is not None and sheet_name not in tables:
+        return [f"{filename}: missing sheet '{sheet_name}'"]
+    names = list(tables) if sheet_name is None else [sheet_name]
+    for name in names:
+        missing = [col for col in required_cols if col not in tables[name].columns]
+        if missing:
+            problems.append(f"{filename} [{name}]: missing columns {', '.join(missing)}")
+    return problems
+
+
+def read_workbooks(check=check_workbook):
+    """Parse every registered workbook from its .xlsx file.
+
+    Returns ({filename: (sha1, {sheet_name: Table})}, problems), where problems
+    lists missing files and whatever check(filename, tables) reports.
+    """
+    workbooks = {}
+    problems = []
+    for filename in WORKBOOKS:
+        source = workbook_path(filename)
+        if not os.path.exists(source):
+            problems.append(f"{filename}: file not found")
+            continue
+        tables = _read_xlsx(source)
+        problems.extend(check(filename, tables))
+        workbooks[filename] = (file_digest(source), tables)
+    return workbooks, problems
+
+
+def write_snapshot(workbooks, path=SNAPSHOT_PATH, compiled=None):
+    """Write workbooks, as returned by read_workbooks, to a single pickle.
+
+    compiled maps a filename to values derived from it ahead of time, e.g. its
+    validated records; compiled_value() hands them back for that exact version.
+    Each value is pickled on its own, so one that no longer loads cannot make
+    the rest of the snapshot unreadable.
+    """
+    compiled = compiled or {}
+    entries = {filename: {"sha1": digest, "sheets": _snapshot_from_tables(tables),
+                          "compiled": {name: pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+                                       for name, value in compiled.get(filename, {}).items()}}
+               for filename, (digest, tables) in workbooks.items()}
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump({"version": SNAPSHOT_VERSION, "workbooks": entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def compiled_value(filename, digest, name):
+    """Return the value the snapshot holds as name for this version of a workbook, or None.
+
+    None also covers a value that fails to unpickle, e.g. records compiled
+    before a record class changed; callers then build it themselves.
+    """
+    snapshot = _load_snapshot()
+    if snapshot is None:
+        return None
+    entry = snapshot["workbooks"].get(filename)
+    if entry is None or entry["sha1"] != digest or name not in entry["compiled"]:
+        return None
+    try:
+        return pickle.loads(entry["compiled"][name])
+    except Exception:
+        return None
@@ -0,0 +1,166 @@
+# contentdb.py
+
+import errno
+import json
+import os
+import re
+import sqlite3
+import threading
+
+import content
+
+SCHEMA_VERSION = 1
+
+# --- SQLITE BACKEND ---
+# One table per workbook (content type), one row per worksheet row. Every table
+# is keyed by (sheet, position), so a single title column or a single entry can
+# be read without touching the rest of the content.
+#
+#   workbooks(workbook, table_name, sha1)      one row per imported .xlsx
+#   sheets(workbook, sheet, position, columns)  worksheet order and its columns
+#   <table_name>(sheet, position, <columns>)    the rows themselves
+
+
+def table_name(filename):
+    return re.sub(r'[^a-z0-9]+', '_', os.path.splitext(filename)[0].lower()).strip('_')
+
+
+def _quote(identifier):
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+class SQLiteBackend:
+    name = "sqlite"
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+
+    def _connection(self):
+        # One read-only connection per thread, reopened when the database file
+        # is replaced by a new import so no thread keeps reading the old one.
+        key = content._file_key(self.path)
+        cached = getattr(self._local, "connection", None)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        # The old connection is not closed here: a reader may still be using
+        # it, and it is closed once the last reference goes away.
+        connection = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+        self._local.connection = (key, connection)
+        return connection
+
+    def key(self, filename):
+        # Every import rewrites the whole file, so its (mtime, size) versions all workbooks.
+        return content._file_key(self.path)
+
+    def _workbook(self, connection, filename):
+        found = connection.execute("SELECT table_name, sha1 FROM workbooks WHERE workbook = ?", (filename,)).fetchone()
+        if found is None:
+            raise FileNotFoundError(errno.ENOENT, f"{filename} was not imported into {self.path}", filename)
+        return found
+
+    def _columns(self, connection, filename, sheet_name):
+        found = connection.execute("SELECT columns FROM sheets WHERE workbook = ? AND sheet = ?",
+                                   (filename, sheet_name)).fetchone()
+        if found is None:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found in {filename}")
+        return json.loads(found[0])
+
+    def load(self, filename):
+        connection = self._connection()
+        table, digest = self._workbook(connection, filename)
+        tables = {}
+        for sheet_name, columns in connection.execute(
+                "SELECT sheet, columns FROM sheets WHERE workbook = ? ORDER BY position", (filename,)).fetchall():
+            columns = json.loads(columns)
+            rows = connection.execute(
+                f"SELECT {', '.join(map(_quote, columns)) or 'NULL'} FROM {_quote(table)} "
+                f"WHERE sheet = ? ORDER BY position", (sheet_name,)).fetchall()
+            tables[sheet_name] = content.Table(columns, [row[:len(columns)] for row in rows])
+        return digest, tables
+
+    def reader(self, filename):
+        return SQLiteReader(self, filename)
+
+
+class SQLiteReader:
+    """Narrow reads of one workbook through a single connection.
+
+    An import replaces the database file rather than rewriting it, so a
+    connection opened before the swap keeps reading the version it started with.
+    """
+
+    __slots__ = ("filename", "backend", "connection", "table")
+
+    def __init__(self, backend, filename):
+        self.filename = filename
+        self.backend = backend
+        self.connection = backend._connection()
+        self.table = backend._workbook(self.connection, filename)[0]
+
+    def sheet_columns(self):
+        return {sheet_name: tuple(json.loads(columns)) for sheet_name, columns in self.connection.execute(
+            "SELECT sheet, columns FROM sheets WHERE workbook = ? ORDER BY position", (self.filename,))}
+
+    def column(self, sheet_name, name):
+        if name not in self.backend._columns(self.connection, self.filename, sheet_name):
+            raise KeyError(name)
+        return tuple(value for value, in self.connection.execute(
+            f"SELECT {_quote(name)} FROM {_quote(self.table)} WHERE sheet = ? ORDER BY position", (sheet_name,)))
+
+    def row(self, sheet_name, position):
+        columns = self.backend._columns(self.connection, self.filename, sheet_name)
+        found = self.connection.execute(
+            f"SELECT {', '.join(map(_quote, columns))} FROM {_quote(self.table)} WHERE sheet = ? AND position = ?",
+            (sheet_name, position)).fetchone()
+        if found is None:
+            raise IndexError(f"{self.filename} [{sheet_name}] has no row {position}")
+        return dict(zip(columns, found))
+
+
+# --- IMPORT ---
+
+def _create(connection, filename, digest, tables):
+    table = table_name(filename)
+    columns = []
+    for sheet in tables.values():
+        columns += [name for name in sheet.columns if name not in columns]
+    # No declared column types: values keep the Python type pandas read them as.
+    definitions = ", ".join(["sheet TEXT NOT NULL", "position INTEGER NOT NULL"] + [_quote(name) for name in columns])
+    connection.execute(f"CREATE TABLE {_quote(table)} ({definitions}, PRIMARY KEY (sheet, position))")
+    connection.execute("INSERT INTO workbooks VALUES (?, ?, ?)", (filename, table, digest))
+    for sheet_position, (sheet_name, sheet) in enumerate(tables.items()):
+        connection.execute("INSERT INTO sheets VALUES (?, ?, ?, ?)",
+                           (filename, sheet_name, sheet_position, json.dumps(list(sheet.columns))))
+        names = ", ".join(["sheet", "position"] + [_quote(name) for name in sheet.columns])
+        placeholders = ", ".join("?" * (len(sheet.columns) + 2))
+        connection.executemany(f"INSERT INTO {_quote(table)} ({names}) VALUES ({placeholders})",
+                               ((sheet_name, position) + values for position, values in enumerate(sheet.rows)))
+
+
+def import_workbooks(path=content.DB_PATH, check=content.check_workbook):
+    """Import every registered workbook into a fresh SQLite database at path.
+
+    Returns a list of validation problems; the database is only replaced when
+    the list is empty.
+    """
+    workbooks, problems = content.read_workbooks(check)
+    if problems:
+        return problems
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    connection = sqlite3.connect(tmp_path)
+    try:
+        with connection:
+            connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            connection.execute("CREATE TABLE workbooks (workbook TEXT PRIMARY KEY, table_name TEXT NOT NULL, "
+                               "sha1 TEXT NOT NULL)")
+            connection.execute("CREATE TABLE sheets (workbook TEXT NOT NULL, sheet TEXT NOT NULL, "
+                               "position INTEGER NOT NULL, columns TEXT NOT NULL, PRIMARY KEY (workbook, sheet))")
+            for filename, (digest, tables) in workbooks.items():
+                _create(connection, filename, digest, tables)
+    finally:
+        connection.close()
+    os.replace(tmp_path, path)
+    return []
@@ -0,0 +1,241 @@
+# export.py
+
+import hashlib
+import json
+import os
+import re
+import time
+
+import content
+import fragments
+import images
+from fragments import attr, esc, subheader
+
+EXPORT_VERSION = 2
+MANIFEST_NAME = "manifest.json"
+
+# --- STATIC SITE ---
+# Writes the portfolio as plain HTML/CSS built from the same records and
+# fragments the Streamlit app renders, so it can be served from any static host.
+
+SITE_TITLE = "Gururaj H C | PhD Candidate"
+SITE_CSS = """
+    body {
+        margin: 0;
+        color: #FAFAFA;
+        background-color: #111111;
+    }
+    .site {
+        display: flex;
+        min-height: 100vh;
+    }
+    .site [data-testid="stSidebar"] {
+        flex: 0 0 260px;
+        padding: 2rem 1.5rem;
+        background-color: #262730;
+    }
+    .site main {
+        flex: 1;
+        max-width: 1100px;
+        padding: 2rem 3rem;
+    }
+    .site a {
+        color: #FF4B4B;
+    }
+    .site nav a {
+        display: block;
+        padding: 0.5rem 0.75rem;
+        color: #FAFAFA;
+        text-decoration: none;
+        background-color: #1E1E1E;
+    }
+    .site nav a:hover {
+        background-color: #333333;
+    }
+    .site nav a.selected {
+        background-color: #FF4B4B;
+    }
+    .home-grid {
+        display: grid;
+        grid-template-columns: 1fr 2fr;
+        gap: 3rem;
+    }
+    .tab-title {
+        color: #FF4B4B;
+        margin-top: 2rem;
+    }
+    details {
+        border: 1px solid #333333;
+        border-radius: 0.5rem;
+        padding: 0.75rem 1rem;
+        margin-bottom: 0.5rem;
+    }
+    summary {
+        cursor: pointer;
+        font-weight: bold;
+    }
+    .link-button {
+        display: block;
+        text-align: center;
+        padding: 0.5rem;
+        border: 1px solid #555555;
+        border-radius: 0.5rem;
+        text-decoration: none;
+    }
+    @media (max-width: 800px) {
+        .site, .home-grid {
+            display: block;
+        }
+    }
+"""
+FAVICON = "data:image/svg+xml,<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'><text y='.9em' font-size='90'>🧠</text></svg>"
+
+
+def slug(name):
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+
+
+def page_file(name):
+    return "index.html" if name == content.PAGES[0][0] else f"{slug(name)}.html"
+
+
+def _profile_img(sizes, width):
+    one_x, two_x = sizes[width]
+    return f"<img src='{one_x}' srcset='{one_x} 1x, {two_x} 2x' width='{width}' alt='Gururaj H C'>"
+
+
+def _details(title, body):
+    return f"<details><summary>{esc(title)}</summary>{body}</details>"
+
+
+# --- PAGE BODIES ---
+
+def _home_body(filename, profile):
+    return (f"<h1>My True North</h1><hr><div class='home-grid'><div class='profile-image'>{profile(250)}</div>"
+            f"<div>{fragments.load(filename)}</div></div>")
+
+
+def _projects_body(filename, profile):
+    parts = [subheader("Data Science Projects")]
+    project_sheets, bodies_by_sheet = fragments.load_entries(filename)
+    for sheet_name, projects in project_sheets.items():
+        if projects is None:
+            continue
+        bodies = bodies_by_sheet[sheet_name]
+        parts.append(f"<h3 class='tab-title'>{esc(sheet_name.strip())}</h3>")
+        parts.extend(_details(project.title, body) for project, body in zip(projects, bodies))
+    parts.append("<hr><p>For a more extensive archive of my earlier projects, please visit my "
+                 "<a href='https://gururaj-hc-personal-webpage.streamlit.app/'>secondary portfolio</a>.</p>")
+    return "".join(parts)
+
+
+def _papers_body(heading):
+    def body(filename, profile):
+        return subheader(heading) + "".join(
+            _details(paper.title, f"{abstract}<a class='link-button' href='{attr(paper.url)}' "
+                                  f"target='_blank'>{esc(paper.button_label)}</a>") + "<hr>"
+            for paper, abstract in zip(*fragments.load_entries(filename)))
+    return body
+
+
+def _work_projects_body(filename, profile):
+    return subheader("Work Projects") + "".join(
+        _details(project.title, body) + "<hr>"
+        for project, body in zip(*fragments.load_entries(filename)))
+
+
+def _fragment_body(filename, profile):
+    return fragments.load(filename)
+
+
+PAGE_BODIES = {
+    "My_True_North.xlsx": _home_body,
+    "Education.xlsx": _fragment_body,
+    "Data_Science_projects.xlsx": _projects_body,
+    "Pre_prints.xlsx": _papers_body("Pre-prints"),
+    "Publications.xlsx": _papers_body("Publications"),
+    "Work_Experience.xlsx": _fragment_body,
+    "Work_projects.xlsx": _work_projects_body,
+    "Awards_and_Achievements.xlsx": _fragment_body,
+    "Contact_details.xlsx": _fragment_body,
+}
+
+
+def render_page(name, filename, profile):
+    nav = "".join(f"<a href='{page_file(page)}'{' class=selected' if page == name else ''}>{esc(page)}</a>"
+                  for page, _, workbook in content.PAGES if workbook is not None)
+    return (f"<!DOCTYPE html>\n<html lang='en'><head><meta charset='utf-8'>"
+            f"<meta name='viewport' content='width=device-width, initial-scale=1'>"
+            f"<title>{esc(name)} | {esc(SITE_TITLE)}</title><link rel='icon' href=\"{FAVICON}\">"
+            f"<link rel='stylesheet' href='style.css'></head>\n"
+            f"<body><div class='site'><aside data-testid='stSidebar'><div class='profile-image'>{profile(120)}</div>"
+            f"<h1>Gururaj H C</h1><p>Independent researcher &amp; Data Scientist</p><hr><nav>{nav}</nav></aside>"
+            f"<main>{PAGE_BODIES[filename](filename, profile)}</main></div></body></html>\n")
+
+
+# --- BUILD ---
+
+def _write(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data.encode("utf-8") if isinstance(data, str) else data)
+    os.replace(tmp_path, path)
+
+
+def _signature():
+    # Anything that changes every page at once: layout, styles and navigation.
+    return hashlib.sha1(repr((EXPORT_VERSION, fragments.PAGE_CSS, SITE_CSS, content.PAGES)).encode("utf-8")).hexdigest()
+
+
+def _write_images(out_dir):
+    os.makedirs(os.path.join(out_dir, "images"), exist_ok=True)
+    ext = images.extension(images.default_format())
+    sizes = {}
+    for width in images.PROFILE_WIDTHS:
+        paths = []
+        for scale, data in images.derivatives(images.PROFILE_IMAGE, width).items():
+            rel_path = f"images/profile-{width * scale}.{ext}"
+            _write(os.path.join(out_dir, rel_path), data)
+            paths.append(rel_path)
+        sizes[width] = paths
+    return sizes
+
+
+def export_site(out_dir, force=False):
+    """Write the static site to out_dir, rebuilding only pages whose inputs changed.
+
+    Returns [(page name, output file, "built" | "unchanged", seconds), ...].
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, MANIFEST_NAME)
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    signature = _signature()
+    if force or manifest.get("signature") != signature:
+        manifest = {"signature": signature, "pages": {}}
+
+    image_digest = content.file_digest(os.path.join(content.BASE_DIR, images.PROFILE_IMAGE))
+    _write(os.path.join(out_dir, "style.css"), fragments.PAGE_CSS + SITE_CSS)
+    sizes = None
+    report = []
+    for name, _, filename in content.PAGES:
+        # Pages without a workbook (search) need the server and are left out of the static site.
+        if filename is None:
+            continue
+        start = time.perf_counter()
+        output = page_file(name)
+        inputs = {filename: content.version(filename).digest, images.PROFILE_IMAGE: image_digest}
+        previous = manifest["pages"].get(output)
+        if previous == inputs and os.path.exists(os.path.join(out_dir, output)):
+            report.append((name, output, "unchanged", time.perf_counter() - start))
+            continue
+        if sizes is None:
+            sizes = _write_images(out_dir)
+        _write(os.path.join(out_dir, output), render_page(name, filename, lambda width: _profile_img(sizes, width)))
+        manifest["pages"][output] = inputs
+        report.append((name, output, "built", time.perf_counter() - start))
+    _write(manifest_path, json.dumps(manifest, indent=2))
+    return report
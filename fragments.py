@@ -0,0 +1,353 @@
+# fragments.py
+
+import base64
+import html
+import re
+from urllib.parse import quote_plus
+
+import content
+import images
+import metrics
+import records
+
+# --- CUSTOM CSS FOR A CLASSY LOOK ---
+# Web fonts come from Google unless self-hosted copies are served by assets.py.
+FONT_IMPORTS = """
+    @import url('https://fonts.googleapis.com/css2?family=Agdasima');
+    @import url('https://fonts.googleapis.com/css2?family=Roboto');
+"""
+STYLE_CSS = """
+    /* General font and theme adjustments */
+    body {
+        font-family: 'Roboto', sans-serif;
+    }
+    .stApp {
+        background-color: #111111;
+    }
+
+    [data-testid="stSidebar"] h1 {
+        font-size: 1.8rem;
+    }
+    [data-testid="stSidebar"] p {
+        font-size: 0.9rem;
+        margin-bottom: 1rem;
+    }
+
+    /* Main content styling */
+    h1, h2 {
+        color: #FAFAFA;
+    }
+
+    .custom-subheader {
+        font-family: 'Agdasima', sans-serif !important;
+        font-size: 32px !important;
+        color: cyan !important;
+        font-weight: bold;
+        margin-top: 20px;
+        margin-bottom: 10px;
+    }
+
+    .keyword-title {
+        font-family: 'Agdasima', sans-serif !important;
+        font-size: 1.3em !important;
+        color: cyan !important;
+        font-weight: bold;
+    }
+
+    /* Classy image styling */
+    .profile-image img {
+        border-radius: 50%;
+        border: 3px solid #FF4B4B;
+        box-shadow: 0 0 15px rgba(255, 75, 75, 0.5);
+        transition: transform 0.3s ease-in-out;
+    }
+    .profile-image img:hover {
+        transform: scale(1.05);
+    }
+
+    .justified-text, .publication-abstract {
+        text-align: justify;
+    }
+
+    .degree-title, .job-title {
+        font-size: 1.25rem;
+        font-weight: bold;
+        color: #FAFAFA;
+    }
+    .institution-name, .organization-name {
+        font-style: italic;
+        color: #AAAAAA;
+    }
+    .year-text, .duration-text {
+        text-align: right;
+        color: #AAAAAA;
+    }
+
+    .st-emotion-cache-p5msec {
+        font-size: 1.1rem;
+    }
+    .st-emotion-cache-p5msec:hover {
+        color: #FF4B4B;
+    }
+    .github-link {
+        font-weight: bold;
+        color: #FF4B4B;
+    }
+
+    /* Contact page styling */
+    .contact-icon {
+        display: inline-block;
+        width: 30px;
+        vertical-align: middle;
+        margin-right: 10px;
+    }
+    .contact-link a {
+        font-size: 1.1rem;
+        color: #CCCCCC;
+        text-decoration: none;
+        vertical-align: middle;
+    }
+    .contact-link a:hover {
+        color: #FF4B4B;
+        text-decoration: underline;
+    }
+    .contact-row {
+        margin-bottom: 1.5rem;
+    }
+
+    /* Pre-rendered page fragments */
+    .entry-row {
+        display: flex;
+        justify-content: space-between;
+        align-items: flex-start;
+        gap: 1rem;
+    }
+    .entry-row > div {
+        flex: 3;
+    }
+    .entry-row > p {
+        flex: 1;
+    }
+    .content-entry {
+        margin-top: 1rem;
+    }
+    .content-block {
+        margin-bottom: 1rem;
+    }
+
+"""
+PAGE_CSS = FONT_IMPORTS + STYLE_CSS
+
+# --- HTML FRAGMENTS ---
+# Static page content is rendered to HTML once per content version and cached
+# next to the records, so a rerun only ships a handful of large markdown deltas
+# instead of one element per title and bullet.
+
+CONTACT_INTRO = ("I'm actively seeking PhD opportunities and welcome connections from researchers and academic "
+                 "groups. Please feel free to reach out.")
+CONTACT_ICONS = {
+    "email id": """<svg class="contact-icon" xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M4 4h16c1.1 0 2 .9 2 2v12c0 1.1-.9 2-2 2H4c-1.1 0-2-.9-2-2V6c0-1.1.9-2 2-2z"></path><polyline points="22,6 12,13 2,6"></polyline></svg>""",
+    "linkedin profile": """<svg class="contact-icon" xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M16 8a6 6 0 0 1 6 6v7h-4v-7a2 2 0 0 0-2-2 2 2 0 0 0-2 2v7h-4v-7a6 6 0 0 1 6-6z"></path><rect x="2" y="9" width="4" height="12"></rect><circle cx="4" cy="4" r="2"></circle></svg>""",
+    "github link": """<svg class="contact-icon" xmlns="http://www.w3.org/2000/svg" width="24" height="24" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"><path d="M9 19c-5 1.5-5-2.5-7-3m14 6v-3.87a3.37 3.37 0 0 0-.94-2.61c3.14-.35 6.44-1.54 6.44-7A5.44 5.44 0 0 0 20 4.77 5.07 5.07 0 0 0 19.91 1S18.73.65 16 2.48a13.38 13.38 0 0 0-7 0C6.27.65 5.09 1 5.09 1A5.07 5.07 0 0 0 5 4.77a5.44 5.44 0 0 0-1.5 3.78c0 5.42 3.3 6.61 6.44 7A3.37 3.37 0 0 0 9 18.13V22"></path></svg>"""
+}
+
+
+_profile_html = {}
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+
+def _ascii(value):
+    # Non-ASCII text becomes character references. One accented letter or
+    # emoji would otherwise store the whole cached fragment at 2 or 4 bytes
+    # per character.
+    return value.encode("ascii", "xmlcharrefreplace").decode("ascii")
+
+
+def esc(value):
+    # Newlines are folded into spaces: a blank line would end the HTML block in
+    # st.markdown and the rest of the fragment would be parsed as markdown.
+    return _ascii(html.escape(value, quote=False).replace("\n", " "))
+
+
+def attr(value):
+    return _ascii(html.escape(value, quote=True))
+
+
+def paragraphs(value):
+    """Return one <p> per blank-line-separated paragraph of a multi-paragraph cell."""
+    return "".join(f"<p>{esc(paragraph)}</p>" for paragraph in _PARAGRAPH_BREAK.split(value) if paragraph.strip())
+
+
+def subheader(text):
+    return f'<p class="custom-subheader">{esc(text)}</p>'
+
+
+def bullet_list(points):
+    return "<ul class='content-list'>" + "".join(f"<li>{esc(point)}</li>" for point in points) + "</ul>"
+
+
+@metrics.loading
+def profile_image_html(width):
+    # Inlined rather than passed to st.image, which would re-open the bytes with PIL.
+    # The base64 markup is kept next to the bytes it encodes, so every session
+    # shares one string instead of encoding the photo again on each rerun.
+    data = images.profile_image(width)
+    cached = _profile_html.get(width)
+    if cached is not None and cached[0] is data:
+        return cached[1]
+    markup = (f"<div class='profile-image'><img src='data:{images.mime_type(data)};base64,"
+              f"{base64.b64encode(data).decode('ascii')}' width='{width}' alt='Gururaj H C'></div>")
+    _profile_html[width] = (data, markup)
+    return markup
+
+
+def cached_profile_html():
+    return {width: markup for width, (_, markup) in _profile_html.items()}
+
+
+def _join_entries(entries):
+    return "<hr>".join(f"<div class='content-entry'>{entry}</div>" for entry in entries)
+
+
+# --- PAGE BUILDERS ---
+
+def true_north_html(sections):
+    return "".join(f"{subheader(section.subtitle)}"
+                   f"<div class='justified-text content-block'>{paragraphs(section.content)}</div>"
+                   for section in sections)
+
+
+def education_html(entries):
+    return subheader("Education") + _join_entries(
+        f"<div class='entry-row'><div><p class='degree-title'>{esc(entry.degree)}</p>"
+        f"<p class='institution-name'>{esc(entry.institution)}</p></div>"
+        f"<p class='year-text'>{esc(entry.year)}</p></div>"
+        for entry in entries)
+
+
+def work_experience_html(jobs):
+    return subheader("Work Experience") + _join_entries(
+        f"<div class='entry-row'><div><p class='job-title'>{esc(job.designation)}</p>"
+        f"<p class='organization-name'>{esc(job.organization)}</p></div>"
+        f"<p class='duration-text'>{esc(job.duration)}</p></div>{bullet_list(job.points)}"
+        for job in jobs)
+
+
+def _award_body(points):
+    parts = []
+    bullets = []
+    for point, is_bullet in points:
+        if is_bullet:
+            bullets.append(point)
+            continue
+        if bullets:
+            parts.append(bullet_list(bullets))
+            bullets = []
+        parts.append(f"<p>{esc(point)}</p>")
+    if bullets:
+        parts.append(bullet_list(bullets))
+    return "".join(parts)
+
+
+def awards_html(awards):
+    return subheader("Awards and Achievements") + _join_entries(
+        f"<p class='job-title'>{esc(award.timeline)}</p>{_award_body(award.points)}" for award in awards)
+
+
+def contacts_html(contacts):
+    lines = []
+    for contact in contacts:
+        icon_html = CONTACT_ICONS.get(contact.key, "&bull;")
+        if contact.key == "email id":
+            display_link = f"<a href='mailto:{attr(contact.link)}' target='_blank'>{esc(contact.link)}</a>"
+        else:
+            display_link = f"<a href='{attr(contact.link)}' target='_blank'>{esc(contact.platform)}</a>"
+        lines.append(f"<p class='contact-row'>{icon_html} <span class='contact-link'>{display_link}</span></p>")
+    return subheader("Get in Touch") + f"<p class='content-block'>{esc(CONTACT_INTRO)}</p>" + "".join(lines)
+
+
+def project_body_html(project):
+    parts = [paragraphs(project.intro)] if project.intro else []
+    if project.sections:
+        parts.append("<ul class='content-list'>" + "".join(
+            f"<li><span class='keyword-title'>{esc(keyword)}:</span> {esc(section_text)}</li>"
+            for keyword, section_text in project.sections) + "</ul>")
+    parts.append(f"<p class='content-block'>&#128279; <a href='{attr(project.github)}' class='github-link' "
+                 f"target='_blank'>View on GitHub</a></p>")
+    return "".join(parts)
+
+
+def work_project_body_html(project):
+    parts = [f"<div class='content-block'>{paragraphs(project.description)}</div>"]
+    for section, points in project.sections:
+        parts.append(f"<span class='keyword-title'>{esc(section)}:</span>{bullet_list(points)}")
+    return "".join(parts)
+
+
+def abstract_html(paper):
+    return f"<div class='publication-abstract content-block'>{paragraphs(paper.abstract)}</div>"
+
+
+# Body of a single expander entry, for pages that build bodies only once they are opened.
+ENTRY_HTML = {
+    "Data_Science_projects.xlsx": project_body_html,
+    "Pre_prints.xlsx": abstract_html,
+    "Publications.xlsx": abstract_html,
+    "Work_projects.xlsx": work_project_body_html,
+}
+
+
+def search_results_html(results):
+    entries = []
+    for _, doc in results:
+        title = f"<a href='{attr(doc.url)}' target='_blank'>{esc(doc.title)}</a>" if doc.url else esc(doc.title)
+        # The category links back to the page the result lives on, through the ?page= deep link.
+        category = f"<a href='?page={attr(quote_plus(doc.page))}' target='_self'>{esc(doc.category)}</a>"
+        entries.append(f"<p class='job-title'>{title}</p><p class='organization-name'>{category}</p>"
+                       f"<p class='justified-text'>{esc(doc.snippet)}</p>")
+    return _join_entries(entries)
+
+
+def _project_sheets_html(project_sheets):
+    def sheet_html(sheet_name):
+        projects = project_sheets[sheet_name]
+        return None if projects is None else tuple(project_body_html(project) for project in projects)
+    return records.LazyMapping(project_sheets, sheet_html)
+
+
+BUILDERS = {
+    "My_True_North.xlsx": true_north_html,
+    "Education.xlsx": education_html,
+    "Data_Science_projects.xlsx": _project_sheets_html,
+    "Pre_prints.xlsx": lambda papers: tuple(abstract_html(paper) for paper in papers),
+    "Publications.xlsx": lambda papers: tuple(abstract_html(paper) for paper in papers),
+    "Work_Experience.xlsx": work_experience_html,
+    "Work_projects.xlsx": lambda projects: tuple(work_project_body_html(project) for project in projects),
+    "Awards_and_Achievements.xlsx": awards_html,
+    "Contact_details.xlsx": contacts_html,
+}
+
+
+def _build(current):
+    return BUILDERS[current.filename](records.of(current))
+
+
+def of(current):
+    """Return the cached HTML of a ContentVersion: one string per page, or one per expander body."""
+    return current.derive("html", _build)
+
+
+@metrics.loading
+def load(filename):
+    return of(content.version(filename))
+
+
+@metrics.loading
+def load_entries(filename):
+    """Return (records, html) of the same version of a workbook.
+
+    Pages that pair each title with its body need both from one version; two
+    separate loads could straddle a watcher swap and mismatch them.
+    """
+    current = content.version(filename)
+    return records.of(current), of(current)
@@ -0,0 +1,169 @@
+# images.py
+
+import hashlib
+import io
+import os
+import threading
+
+from content import BASE_DIR
+
+PROFILE_IMAGE = "Gururaj_H_C_PhD_candidate_photo.png"
+CACHE_DIR = os.path.join(BASE_DIR, ".image_cache")
+SCALES = (1, 2)
+PROFILE_WIDTHS = (120, 250)
+
+# --- IMAGE DERIVATIVES ---
+# The source PNG is decoded at most once per content hash; every (width, scale,
+# format) variant is encoded from that decode and kept in memory and on disk.
+_lock = threading.Lock()
+_encode_lock = threading.Lock()
+_digests = {}
+_derivatives = {}
+_formats = []
+
+
+def _source_digest(path):
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        cached = _digests.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with open(path, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()
+    with _lock:
+        previous = _digests.get(path)
+        _digests[path] = (key, digest)
+        # Only the current version of an image is kept in memory; an edited
+        # photo drops the derivatives of the one it replaced.
+        if previous is not None and previous[1] != digest:
+            for stale in [entry for entry in _derivatives if entry[0] == previous[1]]:
+                del _derivatives[stale]
+    return digest
+
+
+def _remember(digest, size, fmt, data):
+    # An encode that finishes after its source changed is not kept.
+    with _lock:
+        if any(current == digest for _, current in _digests.values()):
+            _derivatives[(digest, size, fmt)] = data
+
+
+def default_format():
+    if not _formats:
+        from PIL import features
+        _formats.append("WEBP" if features.check("webp") else "JPEG")
+    return _formats[0]
+
+
+def extension(fmt):
+    return fmt.lower().replace("jpeg", "jpg")
+
+
+def mime_type(data):
+    return "image/webp" if data[:4] == b"RIFF" and data[8:12] == b"WEBP" else "image/jpeg"
+
+
+def _encode(path, sizes, fmt):
+    from PIL import Image
+    with Image.open(path) as source:
+        source.load()
+        encoded = {}
+        for width in sizes:
+            height = round(source.height * width / source.width)
+            image = source.resize((width, height), Image.LANCZOS)
+            if fmt == "JPEG" and image.mode != "RGB":
+                image = image.convert("RGB")
+            buffer = io.BytesIO()
+            if fmt == "WEBP":
+                image.save(buffer, format=fmt, quality=85, method=6)
+            else:
+                image.save(buffer, format=fmt, quality=85, optimize=True, progressive=True)
+            encoded[width] = buffer.getvalue()
+    return encoded
+
+
+def _write_cache_file(path, data):
+    # The disk cache is only an optimization; a read-only deploy still works from memory.
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _cache_file(digest, size, fmt):
+    return os.path.join(CACHE_DIR, f"{digest[:16]}-{size}.{extension(fmt)}")
+
+
+def _cached(digest, size, fmt):
+    with _lock:
+        data = _derivatives.get((digest, size, fmt))
+    if data is None:
+        try:
+            with open(_cache_file(digest, size, fmt), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        _remember(digest, size, fmt, data)
+    return data
+
+
+def encoded_sizes(filename, sizes, fmt=None):
+    """Return {pixel width: encoded bytes}, decoding the source once for all missing sizes."""
+    path = os.path.join(BASE_DIR, filename)
+    digest = _source_digest(path)
+    if fmt is None:
+        # A complete WebP set in the cache means this build supports WebP, so a
+        # warm rerun never has to import PIL just to pick the format.
+        result = {size: _cached(digest, size, "WEBP") for size in sizes}
+        if all(data is not None for data in result.values()):
+            return result
+        fmt = default_format()
+    result = {size: _cached(digest, size, fmt) for size in sizes}
+    if all(data is not None for data in result.values()):
+        return result
+    # Serialize encodes so a rerun racing the background watcher reuses its
+    # output instead of decoding the PNG a second time.
+    with _encode_lock:
+        result = {size: _cached(digest, size, fmt) for size in sizes}
+        missing = [size for size, data in result.items() if data is None]
+        if missing:
+            encoded = _encode(path, missing, fmt)
+            for size in missing:
+                result[size] = encoded[size]
+                _remember(digest, size, fmt, encoded[size])
+                _write_cache_file(_cache_file(digest, size, fmt), encoded[size])
+    return result
+
+
+def derivatives(filename, width, fmt=None):
+    """Return {scale: encoded bytes} for the 1x and 2x variants of an image at a display width."""
+    encoded = encoded_sizes(filename, [width * scale for scale in SCALES], fmt)
+    return {scale: encoded[width * scale] for scale in SCALES}
+
+
+def warm_profile_image(extra_sizes=()):
+    """Encode every profile width from a single decode, e.g. after the photo changed on disk."""
+    return encoded_sizes(PROFILE_IMAGE, sorted({w * s for w in PROFILE_WIDTHS for s in SCALES} | set(extra_sizes)))
+
+
+def profile_image(width, scale=2):
+    # Every display width is produced from the same decode on a cold cache.
+    return warm_profile_image([width * scale])[width * scale]
+
+
+def cached_derivatives():
+    """Return {(digest, pixel width, format): bytes} for every encoded image held in memory."""
+    with _lock:
+        return dict(_derivatives)
+
+
+def clear_cache():
+    """Drop the in-memory derivatives; the files under CACHE_DIR are kept."""
+    with _lock:
+        _digests.clear()
+        _derivatives.clear()
@@ -0,0 +1,85 @@
+# memory.py
+
+import sys
+import types
+
+import content
+import fragments
+import images
+import search
+
+# --- SHARED CONTENT STORE ---
+# Everything a page renders from is held once per process: the parsed tables,
+# records and HTML on each ContentVersion, the encoded photo bytes and their
+# markup, and the search index. Sessions only keep references to these, so the
+# footprint below is what the content costs however many sessions are open.
+
+_ATOMS = (str, bytes, int, float, bool, type(None))
+# Code is not content: builders and factories are shared with the modules anyway.
+_SKIPPED = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+
+def _slot_values(obj):
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            try:
+                yield getattr(obj, slot)
+            except AttributeError:
+                pass
+
+
+def sizeof(obj, seen=None):
+    """Return the deep size of obj in bytes, skipping objects already in seen.
+
+    Pass the same seen set to successive calls so objects shared between parts
+    of the store (a title in a table, its record and the search index) are
+    counted once, under the first part that reaches them.
+    """
+    if seen is None:
+        seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SKIPPED):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, _ATOMS):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (tuple, list, set, frozenset)):
+            stack.extend(obj)
+        else:
+            stack.extend(_slot_values(obj))
+            if hasattr(obj, "__dict__"):
+                stack.append(obj.__dict__)
+    return total
+
+
+def footprint():
+    """Return the bytes held by the shared content store, broken down by part.
+
+    {"workbooks": {filename: {"sheets": ..., "records": ..., "html": ...}},
+     "snapshot": ..., "images": ..., "search": ..., "total": ...}
+    """
+    seen = set()
+    workbooks = {}
+    for filename, current in sorted(content.cached_versions().items()):
+        parts = {"sheets": sizeof(current.sheets, seen)}
+        for name, value in current.derived.items():
+            parts[name] = sizeof(value, seen)
+        workbooks[filename] = parts
+    report = {
+        "workbooks": workbooks,
+        # Sheets loaded from the snapshot share their rows with it; only what is left is counted here.
+        "snapshot": sizeof(content.cached_snapshot(), seen),
+        "images": sizeof((images.cached_derivatives(), fragments.cached_profile_html()), seen),
+        "search": sizeof(search.cached_index(), seen),
+    }
+    report["total"] = (sum(sum(parts.values()) for parts in workbooks.values())
+                       + report["snapshot"] + report["images"] + report["search"])
+    return report
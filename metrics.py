@@ -0,0 +1,242 @@
+# metrics.py
+
+import functools
+import os
+import threading
+import time
+
+import content
+
+# Per-page render metrics, aggregated in-process and exported in the Prometheus
+# text format. Set PORTFOLIO_METRICS_FILE to have them flushed to a file every
+# PORTFOLIO_METRICS_INTERVAL seconds, or PORTFOLIO_METRICS_PORT to serve them
+# at http://<host>:<port>/metrics.
+METRICS_FILE_ENV = "PORTFOLIO_METRICS_FILE"
+METRICS_INTERVAL_ENV = "PORTFOLIO_METRICS_INTERVAL"
+METRICS_PORT_ENV = "PORTFOLIO_METRICS_PORT"
+
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_lock = threading.Lock()
+_local = threading.local()
+_pages = {}
+_exporter = {"started": False}
+_counters = []
+
+
+class Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(BUCKETS):
+            if value <= bound:
+                self.counts[i] += 1
+        self.sum += value
+        self.count += 1
+
+
+class PageMetrics:
+    __slots__ = ("render", "data", "emit", "elements", "errors")
+
+    def __init__(self):
+        self.render = Histogram()
+        self.data = Histogram()
+        self.emit = Histogram()
+        self.elements = 0
+        self.errors = {}
+
+
+class _Render:
+    __slots__ = ("data_seconds", "depth", "elements", "errors")
+
+    def __init__(self):
+        self.data_seconds = 0.0
+        self.depth = 0
+        self.elements = 0
+        self.errors = []
+
+
+def _script_run_context():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return None
+    return get_script_run_ctx(suppress_warning=True)
+
+
+def timed_page(name):
+    """Decorate a page renderer so each call is recorded under the page's name."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            render = _Render()
+            _local.render = render
+            # Count the deltas the page sends by wrapping this run's enqueue.
+            ctx = _script_run_context()
+            if ctx is not None:
+                enqueue = ctx.enqueue
+
+                def counting_enqueue(msg):
+                    if msg.HasField("delta"):
+                        render.elements += 1
+                    enqueue(msg)
+                ctx.enqueue = counting_enqueue
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                if ctx is not None:
+                    del ctx.enqueue
+                _local.render = None
+                _record(name, render, elapsed)
+        return wrapper
+    return decorator
+
+
+def _record(name, render, elapsed):
+    with _lock:
+        page = _pages.get(name)
+        if page is None:
+            page = _pages[name] = PageMetrics()
+        page.render.observe(elapsed)
+        page.data.observe(render.data_seconds)
+        page.emit.observe(max(elapsed - render.data_seconds, 0.0))
+        page.elements += render.elements
+        for error_type in render.errors:
+            page.errors[error_type] = page.errors.get(error_type, 0) + 1
+
+
+def loading(func):
+    """Decorate a content loader so its time counts as data loading in the current render."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        render = getattr(_local, "render", None)
+        if render is None:
+            return func(*args, **kwargs)
+        render.depth += 1
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            render.depth -= 1
+            # Loaders call each other; only the outermost call is counted.
+            if render.depth == 0:
+                render.data_seconds += time.perf_counter() - start
+    return wrapper
+
+
+def register_counters(metric, help_text, label, read):
+    """Export read() -> {label value: count} as a Prometheus counter family."""
+    with _lock:
+        _counters.append((metric, help_text, label, read))
+
+
+def record_error(error):
+    """Count an exception a page renderer caught and turned into an st.error."""
+    render = getattr(_local, "render", None)
+    if render is not None:
+        render.errors.append(type(error).__name__)
+
+
+# --- EXPORT ---
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(metric, page, histogram):
+    lines = []
+    for bound, count in zip(BUCKETS, histogram.counts):
+        lines.append(f'{metric}_bucket{{page="{page}",le="{bound}"}} {count}')
+    lines.append(f'{metric}_bucket{{page="{page}",le="+Inf"}} {histogram.count}')
+    lines.append(f'{metric}_sum{{page="{page}"}} {histogram.sum:.6f}')
+    lines.append(f'{metric}_count{{page="{page}"}} {histogram.count}')
+    return lines
+
+
+def render_prometheus():
+    histograms = (
+        ("portfolio_page_render_seconds", "render", "Wall time of a page render."),
+        ("portfolio_page_data_seconds", "data", "Time a page render spent loading workbook data."),
+        ("portfolio_page_emit_seconds", "emit", "Time a page render spent emitting Streamlit elements."),
+    )
+    with _lock:
+        pages = sorted(_pages.items())
+        lines = []
+        for metric, field, help_text in histograms:
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} histogram"]
+            for name, page in pages:
+                lines += _histogram_lines(metric, _label(name), getattr(page, field))
+        lines += ["# HELP portfolio_page_elements_total Streamlit elements emitted by page renders.",
+                  "# TYPE portfolio_page_elements_total counter"]
+        lines += [f'portfolio_page_elements_total{{page="{_label(name)}"}} {page.elements}' for name, page in pages]
+        lines += ["# HELP portfolio_page_errors_total Exceptions caught and shown as st.error by page renders.",
+                  "# TYPE portfolio_page_errors_total counter"]
+        for name, page in pages:
+            lines += [f'portfolio_page_errors_total{{page="{_label(name)}",type="{_label(error_type)}"}} {count}'
+                      for error_type, count in sorted(page.errors.items())]
+    stats = content.cache_stats()
+    lines += ["# HELP portfolio_content_cache_events_total Workbook cache lookups and loads by kind.",
+              "# TYPE portfolio_content_cache_events_total counter"]
+    lines += [f'portfolio_content_cache_events_total{{kind="{kind}"}} {stats[kind]}'
+              for kind in ("hits", "misses", "snapshot_loads", "xlsx_parses")]
+    with _lock:
+        counters = list(_counters)
+    for metric, help_text, label, read in counters:
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+        lines += [f'{metric}{{{label}="{_label(value)}"}} {count}' for value, count in read().items()]
+    return "\n".join(lines) + "\n"
+
+
+def _flush_loop(path, interval):
+    while True:
+        time.sleep(interval)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(render_prometheus())
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+
+def _serve(port):
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != "/metrics":
+                self.send_error(404)
+                return
+            body = render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    ThreadingHTTPServer(("", port), MetricsHandler).serve_forever()
+
+
+def start_exporter():
+    """Start the configured exporters once per process; a no-op when none is configured."""
+    with _lock:
+        if _exporter["started"]:
+            return
+        _exporter["started"] = True
+    path = os.environ.get(METRICS_FILE_ENV)
+    if path:
+        interval = float(os.environ.get(METRICS_INTERVAL_ENV, "15"))
+        threading.Thread(target=_flush_loop, args=(path, interval), name="metrics-flush", daemon=True).start()
+    port = os.environ.get(METRICS_PORT_ENV)
+    if port:
+        threading.Thread(target=_serve, args=(int(port),), name="metrics-http", daemon=True).start()
@@ -0,0 +1,186 @@
+# prefetch.py
+
+import os
+import queue
+import threading
+import time
+from collections.abc import Mapping
+from contextlib import contextmanager
+
+import content
+import fragments
+import metrics
+import search
+
+# After a page renders, the pages a visitor is most likely to open next are
+# warmed in one background thread, so the next option_menu click does not pay
+# for a workbook parse. Predictions come from the page-to-page transitions seen
+# in this process and fall back to the menu neighbours until there are enough.
+# Set PORTFOLIO_PREFETCH_PAGES to how many pages to warm per render (0 disables).
+PREFETCH_PAGES_ENV = "PORTFOLIO_PREFETCH_PAGES"
+DEFAULT_PAGES = 2
+# Transitions out of a page needed before they are trusted over the menu order.
+MIN_OBSERVATIONS = 5
+# The queue is small and only drained while no page is rendering, so prefetching
+# never holds up a foreground rerun; extra requests are simply dropped.
+QUEUE_SIZE = 4
+IDLE_SECONDS = 0.05
+
+_lock = threading.Lock()
+_idle = threading.Condition(_lock)
+_queue = queue.Queue(QUEUE_SIZE)
+_state = {"thread": None, "active": 0}
+_pending = set()
+_prefetched = set()
+_transitions = {}
+_stats = {"navigations": 0, "predicted": 0, "prefetch_hits": 0,
+          "warmed": 0, "already_warm": 0, "dropped": 0, "errors": 0}
+
+_PAGE_NAMES = tuple(name for name, _, _ in content.PAGES)
+_PAGE_WORKBOOKS = {name: workbook for name, _, workbook in content.PAGES}
+
+
+def page_limit():
+    return int(os.environ.get(PREFETCH_PAGES_ENV, DEFAULT_PAGES))
+
+
+def neighbours(page):
+    """Pages next to page in the menu, nearest first."""
+    index = _PAGE_NAMES.index(page)
+    ordered = []
+    for distance in range(1, len(_PAGE_NAMES)):
+        for candidate in (index + distance, index - distance):
+            if 0 <= candidate < len(_PAGE_NAMES):
+                ordered.append(_PAGE_NAMES[candidate])
+    return ordered
+
+
+def predict(page, limit):
+    """Return up to limit pages most likely to follow page."""
+    with _lock:
+        observed = dict(_transitions.get(page, {}))
+    if sum(observed.values()) >= MIN_OBSERVATIONS:
+        ranked = sorted(observed, key=lambda name: (-observed[name], _PAGE_NAMES.index(name)))
+    else:
+        ranked = []
+    ranked += [name for name in neighbours(page) if name not in ranked]
+    return ranked[:limit]
+
+
+def is_warm(page):
+    workbook = _PAGE_WORKBOOKS[page]
+    if workbook is None:
+        return search.cached_index() is not None
+    return content.is_current(workbook)
+
+
+def warm_page(page):
+    """Load everything page renders from into the shared caches."""
+    workbook = _PAGE_WORKBOOKS[page]
+    if workbook is None:
+        search.index()
+        return
+    html = fragments.load(workbook)
+    if isinstance(html, Mapping):
+        for _ in html.values():
+            pass
+
+
+@contextmanager
+def rendering():
+    """Mark a foreground render; the prefetcher waits until none are running."""
+    with _lock:
+        _state["active"] += 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _state["active"] -= 1
+            if not _state["active"]:
+                _idle.notify_all()
+
+
+def _wait_until_idle():
+    while True:
+        with _lock:
+            while _state["active"]:
+                _idle.wait()
+        # Let a rerun that is just about to start go first.
+        time.sleep(IDLE_SECONDS)
+        with _lock:
+            if not _state["active"]:
+                return
+
+
+def _run():
+    while True:
+        page = _queue.get()
+        _wait_until_idle()
+        with _lock:
+            _pending.discard(page)
+        try:
+            if is_warm(page):
+                kind = "already_warm"
+            else:
+                warm_page(page)
+                kind = "warmed"
+                with _lock:
+                    _prefetched.add(page)
+        except Exception:
+            kind = "errors"
+        with _lock:
+            _stats[kind] += 1
+
+
+def _schedule(page):
+    with _lock:
+        if page in _pending:
+            return
+        if _state["thread"] is None:
+            _state["thread"] = threading.Thread(target=_run, name="prefetch", daemon=True)
+            _state["thread"].start()
+        try:
+            _queue.put_nowait(page)
+        except queue.Full:
+            _stats["dropped"] += 1
+            return
+        _pending.add(page)
+
+
+def after_render(page, previous=None):
+    """Record the navigation that led to page and prefetch the likely next pages.
+
+    previous is what this call returned for the same session last time. The
+    return value, (page, predicted pages), should be kept for the next call.
+    """
+    with _lock:
+        # A page the prefetcher warmed has now paid off, or never will.
+        prefetch_hit = page in _prefetched
+        _prefetched.discard(page)
+        if previous is not None and previous[0] != page:
+            _stats["navigations"] += 1
+            _stats["predicted"] += page in previous[1]
+            _stats["prefetch_hits"] += prefetch_hit
+            counts = _transitions.setdefault(previous[0], {})
+            counts[page] = counts.get(page, 0) + 1
+    limit = page_limit()
+    if limit <= 0:
+        return page, ()
+    predicted = tuple(predict(page, limit))
+    for name in predicted:
+        _schedule(name)
+    return page, predicted
+
+
+def stats():
+    with _lock:
+        return dict(_stats)
+
+
+def transitions():
+    with _lock:
+        return {page: dict(counts) for page, counts in _transitions.items()}
+
+
+metrics.register_counters("portfolio_prefetch_events_total",
+                          "Page navigations, correct predictions and background warm-ups by kind.", "kind", stats)
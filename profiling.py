@@ -0,0 +1,51 @@
+# profiling.py
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Opt-in startup instrumentation: set PORTFOLIO_STARTUP_PROFILE to a file path
+# and every script run appends one JSON line with its phase timings.
+STARTUP_PROFILE_ENV = "PORTFOLIO_STARTUP_PROFILE"
+
+_lock = threading.Lock()
+_runs = {"count": 0}
+
+
+class StartupTimer:
+    def __init__(self):
+        self.path = os.environ.get(STARTUP_PROFILE_ENV)
+        self.phases = []
+        self.start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name):
+        if not self.path:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, (time.perf_counter() - start) * 1000))
+
+    def write(self, **extra):
+        if not self.path:
+            return
+        with _lock:
+            _runs["count"] += 1
+            record = {
+                "timestamp": time.time(),
+                "pid": os.getpid(),
+                # The first run in a process is the cold start autoscaled replicas pay.
+                "run": _runs["count"],
+                "total_ms": round((time.perf_counter() - self.start) * 1000, 3),
+                "phases": {name: round(ms, 3) for name, ms in self.phases},
+                "loaded": {name: name in sys.modules for name in ("pandas", "openpyxl", "PIL")},
+                **extra,
+            }
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
@@ -0,0 +1,343 @@
+# records.py
+
+import math
+import re
+from collections.abc import Mapping
+
+import content
+import metrics
+
+# --- RECORD TYPES ---
+# Each workbook row is normalized once per content version into one of these
+# records, so the page renderers only iterate over ready-made structures.
+# Bump RECORDS_VERSION whenever a builder changes what it produces, so records
+# precompiled into an older snapshot are rebuilt instead of trusted.
+RECORDS_VERSION = 1
+
+
+class TrueNorthSection:
+    __slots__ = ("subtitle", "content")
+
+    def __init__(self, subtitle, content):
+        self.subtitle = subtitle
+        self.content = content
+
+
+class Education:
+    __slots__ = ("degree", "institution", "year")
+
+    def __init__(self, degree, institution, year):
+        self.degree = degree
+        self.institution = institution
+        self.year = year
+
+
+class ProjectRecord:
+    __slots__ = ("title", "intro", "sections", "github")
+
+    def __init__(self, title, intro, sections, github):
+        self.title = title
+        self.intro = intro
+        self.sections = sections  # ((keyword, text), ...) in the order they appear
+        self.github = github
+
+
+class Paper:
+    __slots__ = ("title", "abstract", "url", "button_label")
+
+    def __init__(self, title, abstract, url, button_label):
+        self.title = title
+        self.abstract = abstract
+        self.url = url
+        self.button_label = button_label
+
+
+class WorkExperience:
+    __slots__ = ("designation", "organization", "duration", "points")
+
+    def __init__(self, designation, organization, duration, points):
+        self.designation = designation
+        self.organization = organization
+        self.duration = duration
+        self.points = points
+
+
+class WorkProject:
+    __slots__ = ("title", "description", "sections")
+
+    def __init__(self, title, description, sections):
+        self.title = title
+        self.description = description
+        self.sections = sections  # ((section name, (point, ...)), ...)
+
+
+class Award:
+    __slots__ = ("timeline", "points")
+
+    def __init__(self, timeline, points):
+        self.timeline = timeline
+        self.points = points  # ((text, is_bullet), ...)
+
+
+class Contact:
+    __slots__ = ("platform", "key", "link")
+
+    def __init__(self, platform, key, link):
+        self.platform = platform
+        self.key = key
+        self.link = link
+
+
+# --- NORMALIZATION HELPERS ---
+
+PROJECT_KEYWORDS = ('Task', 'Dataset', 'Method', 'Key Results', 'Impact', 'Tech Stack')
+_KEYWORD_PATTERN = re.compile(r'\b(' + '|'.join(re.escape(kw) for kw in PROJECT_KEYWORDS) + r')\s*:', re.IGNORECASE)
+_CANONICAL_KEYWORDS = {kw.lower(): kw for kw in PROJECT_KEYWORDS}
+WORK_PROJECT_SECTIONS = ('Goal', 'Solution', 'Results', 'Learning')
+
+
+class LazyMapping(Mapping):
+    """An ordered mapping whose values are computed on first access."""
+
+    __slots__ = ("_keys", "_factory", "_values")
+
+    def __init__(self, keys, factory):
+        self._keys = tuple(keys)
+        self._factory = factory
+        self._values = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            if key not in self._keys:
+                raise
+            value = self._values[key] = self._factory(key)
+            return value
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+
+def is_blank(value):
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def text(value):
+    return "" if is_blank(value) else str(value)
+
+
+def split_points(value):
+    return tuple(point.strip() for point in text(value).split('\n') if point.strip())
+
+
+def split_project_description(description):
+    """Split a project description into (intro, ((keyword, text), ...)).
+
+    Only the first occurrence of each keyword starts a section, matching how the
+    page has always read these cells.
+    """
+    found = []
+    seen = set()
+    for match in _KEYWORD_PATTERN.finditer(description):
+        keyword = _CANONICAL_KEYWORDS[match.group(1).lower()]
+        if keyword not in seen:
+            seen.add(keyword)
+            found.append((keyword, match.start(), match.end()))
+    if not found:
+        return description, ()
+    intro = description[:found[0][1]].strip()
+    sections = []
+    for i, (keyword, _, content_start) in enumerate(found):
+        content_end = found[i + 1][1] if i + 1 < len(found) else len(description)
+        section_text = description[content_start:content_end].strip()
+        if section_text:
+            sections.append((keyword, section_text))
+    return intro, tuple(sections)
+
+
+def link_label(url, fallback):
+    try:
+        return f"View on {url.split('/')[2].replace('www.', '').split('.')[0].capitalize()}"
+    except (AttributeError, IndexError):
+        return fallback
+
+
+class ContentError(Exception):
+    pass
+
+
+def _sheet(sheets, filename):
+    sheet_name, required_cols = content.WORKBOOKS[filename]
+    df = sheets[sheet_name]
+    if not all(col in df.columns for col in required_cols):
+        raise ContentError(f"{filename} must contain the columns: {', '.join(required_cols)}")
+    return df
+
+
+# --- BUILDERS ---
+
+def _build_true_north(sheets):
+    df = _sheet(sheets, "My_True_North.xlsx")
+    return tuple(TrueNorthSection(text(row['Sub-title']), text(row['Content'])) for _, row in df.iterrows())
+
+
+def _build_education(sheets):
+    df = _sheet(sheets, "Education.xlsx")
+    return tuple(Education(text(row['Degree']), text(row['Institution']), text(row['Year']))
+                 for _, row in df.iterrows())
+
+
+def _title(filename, value):
+    value = text(value)
+    # Project titles are often typed in bold markdown (**Title**) in the workbook.
+    return value.strip().strip('*') if filename == "Data_Science_projects.xlsx" else value
+
+
+def _project(row, index):
+    intro, sections = split_project_description(text(row['Description']))
+    return ProjectRecord(_title("Data_Science_projects.xlsx", row['Project title']), intro, sections,
+                         text(row['GitHub repo link']))
+
+
+def _build_project_sheet(df):
+    required_cols = content.WORKBOOKS["Data_Science_projects.xlsx"][1]
+    if not all(col in df.columns for col in required_cols):
+        return None
+    return tuple(_project(row, index) for index, row in df.iterrows())
+
+
+def _build_data_science_projects(sheets):
+    # sheet name -> projects (None when the sheet lacks the required columns).
+    # Every sheet is already parsed in one pass over the workbook; normalizing a
+    # sheet waits until its tab is actually shown.
+    return LazyMapping(sheets, lambda sheet_name: _build_project_sheet(sheets[sheet_name]))
+
+
+def _pre_print(row, index):
+    url = text(row['Available at'])
+    return Paper(text(row['Title']), text(row['Abstract']), url, link_label(url, "View Pre-print"))
+
+
+def _publication(row, index):
+    url = text(row['Available at'])
+    # The first three entries are Springer chapters whose links do not name the publisher.
+    label = "View on Springer" if index < 3 else link_label(url, "View Publication")
+    return Paper(text(row['Title']), text(row['Abstract']), url, label)
+
+
+def _build_pre_prints(sheets):
+    return tuple(_pre_print(row, index) for index, row in _sheet(sheets, "Pre_prints.xlsx").iterrows())
+
+
+def _build_publications(sheets):
+    return tuple(_publication(row, index) for index, row in _sheet(sheets, "Publications.xlsx").iterrows())
+
+
+def _build_work_experience(sheets):
+    df = _sheet(sheets, "Work_Experience.xlsx")
+    return tuple(WorkExperience(text(row['Designation']), text(row['Organization']), text(row['Duration']),
+                                split_points(row['Job desscription']))
+                 for _, row in df.iterrows())
+
+
+def _work_project(row, index):
+    sections = tuple((section, split_points(row[section])) for section in WORK_PROJECT_SECTIONS
+                     if text(row[section]).strip())
+    return WorkProject(text(row['Project title']), text(row['Project Description']), sections)
+
+
+def _build_work_projects(sheets):
+    return tuple(_work_project(row, index) for index, row in _sheet(sheets, "Work_projects.xlsx").iterrows())
+
+
+def _award_point(point):
+    # Lead-in sentences stay plain paragraphs; everything else is a bullet.
+    if point.startswith("While working as a Consultant") or point.startswith('•'):
+        return point, False
+    if point.startswith(('-', '*')):
+        return point[1:].strip(), True
+    return point, True
+
+
+def _build_awards(sheets):
+    df = _sheet(sheets, "Awards_and_Achievements.xlsx")
+    return tuple(Award(text(row['Timeline']), tuple(_award_point(point) for point in split_points(row['Description'])))
+                 for _, row in df.iterrows())
+
+
+def _build_contacts(sheets):
+    df = _sheet(sheets, "Contact_details.xlsx")
+    return tuple(Contact(text(row['Platform']), text(row['Platform']).lower().strip(), text(row['Link']))
+                 for _, row in df.iterrows())
+
+
+BUILDERS = {
+    "My_True_North.xlsx": _build_true_north,
+    "Education.xlsx": _build_education,
+    "Data_Science_projects.xlsx": _build_data_science_projects,
+    "Pre_prints.xlsx": _build_pre_prints,
+    "Publications.xlsx": _build_publications,
+    "Work_Experience.xlsx": _build_work_experience,
+    "Work_projects.xlsx": _build_work_projects,
+    "Awards_and_Achievements.xlsx": _build_awards,
+    "Contact_details.xlsx": _build_contacts,
+}
+
+
+def _build(current):
+    # `cli.py compile` validated this exact version and stored its records.
+    compiled = content.compiled_value(current.filename, current.digest, "records")
+    if compiled is not None and compiled[0] == RECORDS_VERSION:
+        return compiled[1]
+    return BUILDERS[current.filename](current.sheets)
+
+
+def of(current):
+    """Return the records of a ContentVersion, built once per version."""
+    return current.derive("records", _build)
+
+
+# --- SINGLE ENTRIES ---
+# Collapsed entries only need their titles, and an entry's body only once it is
+# opened. These read one column or one row through a reader from reader(), which
+# the SQLite backend answers without loading the rest of the workbook. One
+# reader per render keeps every title and body on the same content version.
+
+ENTRY_BUILDERS = {
+    "Data_Science_projects.xlsx": _project,
+    "Pre_prints.xlsx": _pre_print,
+    "Publications.xlsx": _publication,
+    "Work_projects.xlsx": _work_project,
+}
+
+
+@metrics.loading
+def reader(filename):
+    """Return a content reader pinned to the current version of a workbook, for the functions below."""
+    return content.reader(filename)
+
+
+@metrics.loading
+def titles(source, sheet_name=None):
+    sheet_name = sheet_name or content.WORKBOOKS[source.filename][0]
+    return tuple(_title(source.filename, value)
+                 for value in source.column(sheet_name, content.TITLE_COLUMNS[source.filename]))
+
+
+@metrics.loading
+def usable_sheets(source):
+    """Return {sheet name: whether it has the required columns}, without reading any rows."""
+    required_cols = content.WORKBOOKS[source.filename][1]
+    return {name: all(col in columns for col in required_cols)
+            for name, columns in source.sheet_columns().items()}
+
+
+@metrics.loading
+def entry(source, position, sheet_name=None):
+    """Return the record of one entry, e.g. the project behind an expander that was just opened."""
+    sheet_name = sheet_name or content.WORKBOOKS[source.filename][0]
+    return ENTRY_BUILDERS[source.filename](source.row(sheet_name, position), position)
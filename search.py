@@ -0,0 +1,190 @@
+# search.py
+
+import bisect
+import math
+import os
+import pickle
+import re
+import threading
+
+import content
+import metrics
+import records
+
+INDEX_PATH = os.path.join(content.BASE_DIR, "search.index.pkl")
+INDEX_VERSION = 2
+# Workbooks covered by the search page and the menu entry each result links to.
+SOURCES = {
+    "Publications.xlsx": "Publications",
+    "Pre_prints.xlsx": "Pre-prints",
+    "Data_Science_projects.xlsx": "Data Science Projects",
+    "Work_projects.xlsx": "Work Projects",
+}
+
+# BM25 parameters and the weight of title words relative to body words.
+K1 = 1.2
+B = 0.75
+TITLE_WEIGHT = 2
+# A query word that only matches as a prefix ("reinf" -> "reinforcement") counts for less.
+PREFIX_WEIGHT = 0.5
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or that the this to was were which with
+""".split())
+
+_lock = threading.Lock()
+_state = {"sources": None, "index": None}
+
+
+class SearchDoc:
+    __slots__ = ("page", "category", "title", "snippet", "url")
+
+    def __init__(self, page, category, title, snippet, url):
+        self.page = page
+        self.category = category
+        self.title = title
+        self.snippet = snippet
+        self.url = url
+
+
+class SearchIndex:
+    """Inverted index with BM25 scoring; terms are kept sorted for prefix lookups."""
+
+    __slots__ = ("docs", "postings", "terms", "lengths", "avg_length")
+
+    def __init__(self, docs, postings, lengths):
+        self.docs = docs
+        # term -> (doc id, term frequency, doc id, term frequency, ...): one flat
+        # tuple per term instead of a tuple per posting keeps the index compact.
+        self.postings = postings
+        self.terms = tuple(sorted(postings))
+        self.lengths = lengths
+        self.avg_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+
+    def _expand(self, token):
+        """Yield (term, weight) for every indexed term the query token matches."""
+        if token in self.postings:
+            yield token, 1.0
+        start = bisect.bisect_right(self.terms, token)
+        for term in self.terms[start:]:
+            if not term.startswith(token):
+                break
+            yield term, PREFIX_WEIGHT
+
+    def search(self, query, limit=20):
+        scores = {}
+        total = len(self.docs)
+        for token in set(tokenize(query)):
+            best = {}
+            for term, weight in self._expand(token):
+                postings = self.postings[term]
+                doc_count = len(postings) // 2
+                idf = math.log(1 + (total - doc_count + 0.5) / (doc_count + 0.5))
+                for doc_id, tf in zip(postings[::2], postings[1::2]):
+                    norm = K1 * (1 - B + B * self.lengths[doc_id] / self.avg_length)
+                    score = weight * idf * tf * (K1 + 1) / (tf + norm)
+                    if score > best.get(doc_id, 0.0):
+                        best[doc_id] = score
+            for doc_id, score in best.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [(score, self.docs[doc_id]) for doc_id, score in ranked]
+
+
+def tokenize(value):
+    return [token for token in _TOKEN_PATTERN.findall(value.lower()) if token not in STOPWORDS]
+
+
+def _snippet(value, length=220):
+    value = " ".join(value.split())
+    return value if len(value) <= length else value[:length].rsplit(" ", 1)[0] + "…"
+
+
+def _documents(filename, current):
+    page = SOURCES[filename]
+    workbook_records = records.of(current)
+    if filename == "Data_Science_projects.xlsx":
+        for sheet_name, projects in workbook_records.items():
+            for project in projects or ():
+                body = " ".join([project.intro] + [f"{keyword}: {value}" for keyword, value in project.sections])
+                yield SearchDoc(page, f"{page} · {sheet_name.strip()}", project.title, _snippet(body), project.github), body
+    elif filename == "Work_projects.xlsx":
+        for project in workbook_records:
+            body = " ".join([project.description] + [" ".join(points) for _, points in project.sections])
+            yield SearchDoc(page, page, project.title, _snippet(body), ""), body
+    else:
+        for paper in workbook_records:
+            yield SearchDoc(page, page, paper.title, _snippet(paper.abstract), paper.url), paper.abstract
+
+
+def build_index(versions):
+    docs = []
+    postings = {}
+    lengths = []
+    for filename in SOURCES:
+        for doc, body in _documents(filename, versions[filename]):
+            doc_id = len(docs)
+            docs.append(doc)
+            tokens = tokenize(doc.title) * TITLE_WEIGHT + tokenize(body)
+            counts = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            for token, tf in counts.items():
+                postings.setdefault(token, []).extend((doc_id, tf))
+            lengths.append(len(tokens))
+    return SearchIndex(tuple(docs), {term: tuple(entries) for term, entries in postings.items()}, tuple(lengths))
+
+
+def _load_persisted(sources):
+    try:
+        with open(INDEX_PATH, "rb") as f:
+            data = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION or data.get("sources") != sources:
+        return None
+    return data["index"]
+
+
+def save_index(index, sources, path=INDEX_PATH):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump({"version": INDEX_VERSION, "sources": sources, "index": index}, f,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+@metrics.loading
+def index():
+    """Return the search index for the current content, loading or building it once per content version."""
+    versions = {filename: content.version(filename) for filename in SOURCES}
+    sources = {filename: current.digest for filename, current in versions.items()}
+    with _lock:
+        if _state["sources"] == sources:
+            return _state["index"]
+    built = _load_persisted(sources)
+    if built is None:
+        built = build_index(versions)
+        try:
+            save_index(built, sources)
+        except OSError:
+            pass
+    with _lock:
+        _state["sources"], _state["index"] = sources, built
+    return built
+
+
+def cached_index():
+    """Return the index held in memory, or None; unlike index() this never builds one."""
+    with _lock:
+        return _state["index"]
+
+
+def clear_cache():
+    with _lock:
+        _state["sources"] = _state["index"] = None
+
+
+def query(text, limit=20):
+    return index().search(text, limit)
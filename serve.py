@@ -0,0 +1,14 @@
+# serve.py
+#
+# Production entry point: `streamlit run serve.py` runs app.py with the photo,
+# stylesheet and fonts served from /assets/ under hashed, immutable URLs.
+
+import os
+
+import streamlit as st
+
+import assets
+
+os.environ[assets.ASSETS_ENV] = "1"
+
+app = st.App("app.py", routes=assets.routes())
@@ -0,0 +1,120 @@
+# validate.py
+
+import content
+import records
+import search
+
+# --- ROW RULES ---
+# Run once by `cli.py compile` (and `import-db`) before anything is deployed:
+# every cell the pages rely on is checked here, so the renderers can trust the
+# compiled records instead of guarding each rerun. A rule returns None for a
+# good value or a short description of what is wrong with it.
+
+
+def required(value):
+    if records.is_blank(value) or (isinstance(value, str) and not value.strip()):
+        return "is blank"
+    if not isinstance(value, str):
+        return f"should be text, not {type(value).__name__} {value!r}"
+    return None
+
+
+def year(value):
+    if isinstance(value, int) and not isinstance(value, bool):
+        return None
+    return required(value)
+
+
+def url(value):
+    problem = required(value)
+    if problem is None and not value.strip().startswith(("http://", "https://")):
+        problem = f"is not an http(s) link: {value!r}"
+    return problem
+
+
+def optional_url(value):
+    if records.is_blank(value) or (isinstance(value, str) and not value.strip()):
+        return None
+    return url(value)
+
+
+# filename -> {column: rule}; columns not listed only have to exist.
+SCHEMAS = {
+    "My_True_North.xlsx": {"Sub-title": required, "Content": required},
+    "Education.xlsx": {"Degree": required, "Institution": required, "Year": year},
+    "Data_Science_projects.xlsx": {"Project title": required, "Description": required,
+                                   "GitHub repo link": optional_url},
+    "Pre_prints.xlsx": {"Title": required, "Abstract": required, "Available at": url},
+    "Publications.xlsx": {"Title": required, "Abstract": required, "Available at": url},
+    "Work_Experience.xlsx": {"Designation": required, "Organization": required, "Duration": required,
+                             "Job desscription": required},
+    "Work_projects.xlsx": {"Project title": required, "Project Description": required},
+    "Awards_and_Achievements.xlsx": {"Timeline": required, "Description": required},
+    "Contact_details.xlsx": {"Platform": required, "Link": required},
+}
+
+
+def check_workbook(filename, tables):
+    """Return the schema problems of a workbook followed by those of its rows.
+
+    Rows are numbered as in the spreadsheet, where row 1 holds the column names.
+    """
+    problems = content.check_workbook(filename, tables)
+    if problems:
+        return problems
+    sheet_name = content.WORKBOOKS[filename][0]
+    rules = SCHEMAS[filename]
+    for name in (list(tables) if sheet_name is None else [sheet_name]):
+        for index, row in tables[name].iterrows():
+            for column, rule in rules.items():
+                problem = rule(row[column])
+                if problem is not None:
+                    problems.append(f"{filename} [{name}] row {index + 2}: '{column}' {problem}")
+    return problems
+
+
+# --- PRECOMPILATION ---
+
+def compile_records(filename, tables):
+    """Build every record of a workbook up front, e.g. the link-button labels of each paper."""
+    built = records.BUILDERS[filename](tables)
+    if isinstance(built, records.LazyMapping):
+        built = dict(built.items())
+    return built
+
+
+def validate():
+    """Return (workbooks, {filename: records}, problems) for every registered workbook."""
+    workbooks, problems = content.read_workbooks(check_workbook)
+    compiled = {}
+    if problems:
+        return workbooks, compiled, problems
+    for filename, (_, tables) in workbooks.items():
+        try:
+            compiled[filename] = compile_records(filename, tables)
+        except Exception as e:
+            problems.append(f"{filename}: could not build its records: {e!r}")
+    return workbooks, compiled, problems
+
+
+def build(path=content.SNAPSHOT_PATH, index_path=search.INDEX_PATH):
+    """Validate every workbook, then write the snapshot with its precompiled records
+    and the search index built from the same validated content.
+
+    Returns (problems, search index); nothing is written unless problems is empty.
+    """
+    workbooks, compiled, problems = validate()
+    if problems:
+        return problems, None
+    content.write_snapshot(workbooks, path, {filename: {"records": (records.RECORDS_VERSION, built)}
+                                             for filename, built in compiled.items()})
+    # Index exactly what was validated, not whatever the default snapshot holds.
+    versions = {}
+    for filename in search.SOURCES:
+        digest, tables = workbooks[filename]
+        current = versions[filename] = content.ContentVersion(filename, None, digest, tables)
+        current.derived["records"] = compiled[filename]
+    search_index = search.build_index(versions)
+    search.save_index(search_index, {filename: current.digest for filename, current in versions.items()},
+                      index_path)
+    return [], search_index
@@ -0,0 +1,147 @@
+# watcher.py
+
+import os
+import threading
+import time
+from collections.abc import Mapping
+
+import content
+import fragments
+import images
+import search
+
+# Background worker that re-parses changed workbooks (and re-encodes a changed
+# photo) off the request path, so reruns after an edit still hit warm caches.
+# It polls every PORTFOLIO_WATCH_INTERVAL seconds (0 disables it) and, when
+# watchdog can use inotify or an equivalent, wakes up as soon as a file changes.
+WATCH_INTERVAL_ENV = "PORTFOLIO_WATCH_INTERVAL"
+DEFAULT_INTERVAL = 2.0
+WATCHED_EXTENSIONS = (".xlsx", ".png", ".db")
+# Give editors a moment to finish writing before a change event is acted on.
+SETTLE_SECONDS = 0.25
+
+_lock = threading.Lock()
+_state = {"thread": None, "observer": None}
+_stats = {"scans": 0, "refreshes": 0, "errors": 0, "last_error": None}
+
+
+def _watched(name):
+    # "~$" files are the lock files Excel leaves next to an open workbook.
+    return name.endswith(WATCHED_EXTENSIONS) and not name.startswith("~$")
+
+
+def scan():
+    """Return {filename: (mtime_ns, size)} for the watched assets in the content directory."""
+    keys = {}
+    with os.scandir(content.BASE_DIR) as entries:
+        for entry in entries:
+            if _watched(entry.name) and entry.is_file():
+                stat = entry.stat()
+                keys[entry.name] = (stat.st_mtime_ns, stat.st_size)
+    return keys
+
+
+def warm(filename):
+    """Rebuild everything derived from one asset and make it visible in a single swap."""
+    if filename in content.WORKBOOKS:
+        content.refresh(filename)
+        # Registers the HTML builder the first time, so later refreshes rebuild it too.
+        html = fragments.load(filename)
+        if isinstance(html, Mapping):
+            # Lazily built per-sheet bodies: materialize them all while we are off the request path.
+            for _ in html.values():
+                pass
+        if filename in search.SOURCES:
+            search.index()
+    elif filename == images.PROFILE_IMAGE:
+        images.warm_profile_image()
+    elif filename == os.path.basename(content.DB_PATH) and content.backend().name == "sqlite":
+        # A new import versions every workbook at once.
+        for workbook in content.WORKBOOKS:
+            warm(workbook)
+
+
+def warm_all():
+    """Load everything a fully warmed replica holds: every workbook, the photo and the search index."""
+    for filename in (*content.WORKBOOKS, images.PROFILE_IMAGE):
+        warm(filename)
+
+
+def _start_observer(wakeup):
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+
+    class ChangeHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            paths = (event.src_path, getattr(event, "dest_path", ""))
+            if any(_watched(os.path.basename(os.fsdecode(path))) for path in paths if path):
+                wakeup.set()
+
+    observer = Observer()
+    observer.daemon = True
+    try:
+        observer.schedule(ChangeHandler(), content.BASE_DIR, recursive=False)
+        observer.start()
+    except OSError:
+        # No inotify (or out of watches): polling alone still picks changes up.
+        return None
+    return observer
+
+
+def _record_error(filename, error):
+    with _lock:
+        _stats["errors"] += 1
+        _stats["last_error"] = f"{filename}: {error!r}"
+
+
+def _run(interval):
+    wakeup = threading.Event()
+    _state["observer"] = _start_observer(wakeup)
+    seen = {}
+    while True:
+        try:
+            current = scan()
+        except OSError:
+            current = seen
+        with _lock:
+            _stats["scans"] += 1
+        for filename, key in current.items():
+            if seen.get(filename) == key:
+                continue
+            try:
+                warm(filename)
+            except OSError as e:
+                # Leave it unmarked so the next scan retries, e.g. after a half-written save.
+                _record_error(filename, e)
+                continue
+            except Exception as e:
+                # Invalid content fails the same way every time: retry once the file changes again.
+                _record_error(filename, e)
+                seen[filename] = key
+                continue
+            seen[filename] = key
+            with _lock:
+                _stats["refreshes"] += 1
+        if wakeup.wait(interval):
+            wakeup.clear()
+            time.sleep(SETTLE_SECONDS)
+
+
+def start():
+    """Start the watcher once per process. The first scan warms every asset."""
+    interval = float(os.environ.get(WATCH_INTERVAL_ENV, DEFAULT_INTERVAL))
+    if interval <= 0:
+        return
+    with _lock:
+        if _state["thread"] is not None:
+            return
+        _state["thread"] = threading.Thread(target=_run, args=(interval,), name="content-watcher", daemon=True)
+    _state["thread"].start()
+
+
+def stats():
+    with _lock:
+        return dict(_stats)